@@ -0,0 +1,154 @@
+''' runs many start/goal searches over one or more Mazes across worker
+    processes; each maze reaches the workers as a memory-mapped file (see
+    Maze.save / Maze.load) rather than being pickled for every job '''
+from __future__ import annotations
+import os
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, NamedTuple
+
+from Maze import Maze, Position
+
+# the Maze search methods a job may name
+ALGORITHMS = frozenset({"depth_first_search", "breadth_first_search", "bidirectional_search",
+                        "a_star_search", "greedy_search", "jump_point_search",
+                        "iterative_deepening_search", "ida_star_search"})
+
+###########################################################
+class BatchJob(NamedTuple):
+    ''' one search to run: maze is a Maze, or the name of a file written by
+        Maze.save '''
+    maze:      Maze | str
+    start:     Position
+    goal:      Position
+    algorithm: str = "breadth_first_search"
+
+class BatchResult(NamedTuple):
+    ''' the outcome of one BatchJob '''
+    job:      int                # position of the job in the submitted jobs
+    path:     array | None       # flat grid indices, start to goal; None if unreachable
+    expanded: int                # cells the search expanded
+    seconds:  float              # time spent in the search itself
+    error:    str | None = None  # why the job could not run, e.g. a blocked start
+
+# mazes already mapped by this worker process, keyed by file name
+_loaded: dict[str, Maze] = {}
+
+def _runChunk(chunk: list[tuple[int, str, Position, Position, str]]) -> list[BatchResult]:
+    ''' runs a chunk of jobs inside a worker process; a job that cannot run
+        (an unreadable maze file, a start or goal that is blocked or outside
+        the grid) gets a BatchResult carrying the error, rather than raising
+        and losing the rest of the batch '''
+    results = []
+    for job, path, start, goal, algorithm in chunk:
+        try:
+            maze = _loaded.get(path)
+            if maze is None:
+                maze = _loaded[path] = Maze.load(path)
+            view = maze.withEndpoints(start, goal)
+        except (OSError, ValueError) as err:
+            results.append(BatchResult(job, None, 0, 0.0, f"{type(err).__name__}: {err}"))
+            continue
+
+        context = view.newContext()
+        began   = time.perf_counter()
+        found   = getattr(view, algorithm)(context)
+        seconds = time.perf_counter() - began
+
+        cells = None
+        if found is not None:
+            cells = array('q', view._pathIndices(found))
+            cells.reverse()
+        results.append(BatchResult(job, cells, context.getExpanded(), seconds))
+    return results
+
+###########################################################
+class BatchRunner:
+    ''' class to spread BatchJobs over a ProcessPoolExecutor and stream the
+        results back as they finish '''
+    __slots__ = ('_max_workers', '_chunksize', '_completed', '_elapsed')
+
+    def __init__(self, max_workers: int | None = None, chunksize: int = 32) -> None:
+        ''' BatchRunner initializer method
+        Parameters:
+            max_workers: number of worker processes (default: one per core)
+            chunksize:   number of jobs sent to a worker at a time
+        '''
+        self._max_workers: int | None = max_workers
+        self._chunksize:   int        = max(1, chunksize)
+        self._completed:   int        = 0
+        self._elapsed:     float      = 0.0
+
+    def run(self, jobs: Iterable[BatchJob]) -> Iterator[BatchResult]:
+        ''' runs every job, yielding results in the order they finish (use
+            BatchResult.job to match them up); Maze objects are written to a
+            temporary file once each, however many jobs use them
+        Parameters:
+            jobs: BatchJobs, or (maze, start, goal, algorithm) tuples
+        Yields:
+            one BatchResult per job; a job that could not run has path None
+            and says why in error
+        Raises:
+            ValueError if a job names an unknown algorithm
+        '''
+        began = time.perf_counter()
+        self._completed = 0
+        self._elapsed   = 0.0
+
+        with tempfile.TemporaryDirectory(prefix="mazes-") as tmp:
+            paths: dict[int, str] = {}   # id(maze) -> file it was saved to
+            work = []
+            for job, (maze, start, goal, *algorithm) in enumerate(jobs):
+                algorithm = algorithm[0] if algorithm else "breadth_first_search"
+                if algorithm not in ALGORITHMS:
+                    raise ValueError(f"job {job}: unknown algorithm {algorithm!r}")
+                if isinstance(maze, Maze):
+                    if id(maze) not in paths:
+                        paths[id(maze)] = os.path.join(tmp, f"{len(paths)}.maze")
+                        maze.save(paths[id(maze)])
+                    maze = paths[id(maze)]
+                work.append((job, maze, Position(*start), Position(*goal), algorithm))
+
+            chunks = [work[i:i + self._chunksize] for i in range(0, len(work), self._chunksize)]
+            with ProcessPoolExecutor(self._max_workers) as executor:
+                futures = [executor.submit(_runChunk, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    for result in future.result():
+                        self._completed += 1
+                        self._elapsed = time.perf_counter() - began
+                        yield result
+
+    def throughput(self) -> dict[str, float]:
+        ''' reports on the most recent run, for sizing hosts
+        Returns:
+            dict with the number of jobs completed, the wall-clock seconds
+            taken, and jobs completed per second
+        '''
+        return {"jobs":            self._completed,
+                "seconds":         self._elapsed,
+                "jobs_per_second": self._completed / self._elapsed if self._elapsed else 0.0}
+
+
+###################
+def main() -> None:
+    import random
+    maze = Maze.generate(300, 300, seed=1, method="random", solvable=True)
+    rng  = random.Random(1)
+    open_cells = [i for i in range(300 * 300) if maze._moves[i]]
+
+    jobs = []
+    for _ in range(200):
+        start, goal = (Position(*divmod(rng.choice(open_cells), 300)) for _ in range(2))
+        jobs.append(BatchJob(maze, start, goal, rng.choice(["breadth_first_search", "a_star_search"])))
+
+    runner  = BatchRunner()
+    results = sorted(runner.run(jobs))
+    found   = sum(result.path is not None for result in results)
+    print(f"{found} of {len(results)} jobs found a path")
+    print(runner.throughput())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+''' benchmark harness for the containers, maze generation and searches;
+    prints (or writes) machine-readable JSON so runs from different versions
+    can be compared, e.g.
+
+        python Benchmark.py --sides 10 100 1000 --output new.json
+        python Benchmark.py --sides 10 100 1000 --compare old.json
+'''
+from __future__ import annotations
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from Maze import Maze, Position
+from PriorityQueue import PriorityQueue
+from Queue import Queue
+from Stack import Stack
+from linkedList import LinkedList
+import MazeGenerator
+
+
+def _timed(func: Callable[[], object]) -> tuple[float, object]:
+    ''' Returns:
+        the wall-clock seconds func took, and what it returned
+    '''
+    began  = time.perf_counter()
+    result = func()
+    return time.perf_counter() - began, result
+
+
+######################################################################
+def bench_containers(n: int) -> list[dict]:
+    ''' pushes then pops n ints through each container
+    Returns:
+        one record per container, with pushes+pops per second
+    '''
+    def stack(strict: bool) -> Callable[[], None]:
+        def run() -> None:
+            s = Stack[int](strict=strict)
+            for i in range(n): s.push(i)
+            while not s.is_empty(): s.pop()
+        return run
+
+    def queue(**options) -> Callable[[], None]:
+        def run() -> None:
+            q = Queue(**options)
+            for i in range(n): q.push(i)
+            while not q.isempty(): q.pop()
+        return run
+
+    def queue_bulk() -> None:
+        q = Queue(ring=True)
+        q.push_many(range(n))
+        while not q.isempty(): q.pop_many(1024)
+
+    def linked_list(pool: bool) -> Callable[[], None]:
+        def run() -> None:
+            ll = LinkedList[int](strict=False, pool=pool)
+            # interleave adds and removes so a pool actually gets reused
+            for i in range(n):
+                ll.add_right(i)
+                if i % 2: ll.remove_left()
+            while len(ll): ll.remove_left()
+        return run
+
+    def priority_queue() -> None:
+        pq = PriorityQueue[int]()
+        for i in range(n): pq.push(i, (i * 7919) % n)
+        while not pq.is_empty(): pq.pop()
+
+    cases = {"Stack(strict)":          stack(True),
+             "Stack(trusted)":         stack(False),
+             "Queue(LinkedList)":      queue(),
+             "Queue(LinkedList,pool)": queue(strict=False, pool=True),
+             "Queue(ring)":            queue(ring=True),
+             "Queue(ring,bulk)":       queue_bulk,
+             "LinkedList":             linked_list(False),
+             "LinkedList(pool)":       linked_list(True),
+             "PriorityQueue":          priority_queue}
+
+    records = []
+    for name, run in cases.items():
+        seconds, _ = _timed(run)
+        records.append({"container": name, "items": n, "seconds": seconds,
+                        "ops_per_second": 2 * n / seconds if seconds else None})
+    return records
+
+
+def _generate(side: int, seed: int) -> Maze:
+    method = "numpy" if MazeGenerator.np is not None else "random"
+    return Maze.generate(side, side, seed=seed, method=method, solvable=True)
+
+
+def bench_generation(sides: list[int], seed: int) -> list[dict]:
+    ''' Returns:
+        one record per side length, with the time and peak traced memory
+        needed to generate a side x side maze; tracing slows allocation
+        down a lot, so the time comes from a separate, untraced run
+    '''
+    records = []
+    for side in sides:
+        seconds, _ = _timed(lambda: _generate(side, seed))
+
+        tracemalloc.start()
+        _generate(side, seed)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        records.append({"side": side, "cells": side * side, "seconds": seconds,
+                        "peak_bytes": peak})
+    return records
+
+
+def bench_search(sides: list[int], seed: int, algorithms: list[str]) -> list[dict]:
+    ''' Returns:
+        one record per side length and algorithm, with the search's wall
+        time, cells expanded and path length, on the same seeded maze
+    '''
+    records = []
+    for side in sides:
+        maze = _generate(side, seed)
+        for algorithm in algorithms:
+            # bidirectional_search expands from the goal too, into a second
+            # context, so both halves are counted
+            contexts = [maze.newContext()]
+            options  = {}
+            if algorithm == "bidirectional_search":
+                contexts.append(maze.newContext())
+                options["goal_context"] = contexts[1]
+            seconds, goal = _timed(lambda: getattr(maze, algorithm)(contexts[0], **options))
+            length = 0
+            while goal is not None:
+                length += 1
+                goal = goal.getParent()
+            records.append({"side": side, "cells": side * side, "algorithm": algorithm,
+                            "seconds": seconds,
+                            "expanded": sum(context.getExpanded() for context in contexts),
+                            "path_length": length})
+    return records
+
+
+def compare(old: dict, new: dict, threshold: float) -> list[str]:
+    ''' finds every timing in new that is more than threshold times
+        slower than the matching timing in old
+    Returns:
+        one message per regression
+    '''
+    messages = []
+    for section, keys in (("containers", ("container", "items")),
+                          ("generation", ("side",)),
+                          ("search",     ("side", "algorithm"))):
+        before = {tuple(r[k] for k in keys): r for r in old.get(section, [])}
+        for record in new.get(section, []):
+            match = before.get(tuple(record[k] for k in keys))
+            if match and match["seconds"] and record["seconds"] > threshold * match["seconds"]:
+                name = "/".join(str(record[k]) for k in keys)
+                messages.append(f"{section} {name}: {match['seconds']:.4f}s -> {record['seconds']:.4f}s")
+    return messages
+
+
+###################
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sides", type=int, nargs="+", default=[10, 100, 1000],
+                        help="maze side lengths to run (10000 gives 10^8 cells)")
+    parser.add_argument("--items", type=int, default=200_000,
+                        help="items pushed through each container")
+    parser.add_argument("--algorithms", nargs="+",
+                        default=["depth_first_search", "breadth_first_search",
+                                 "bidirectional_search", "a_star_search"])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="file to write the JSON results to (default stdout)")
+    parser.add_argument("--compare", help="earlier JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="slowdown factor reported as a regression by --compare")
+    args = parser.parse_args()
+
+    results = {"python":     sys.version.split()[0],
+               "platform":   platform.platform(),
+               "timestamp":  time.strftime("%Y-%m-%dT%H:%M:%S"),
+               "seed":       args.seed,
+               "containers": bench_containers(args.items),
+               "generation": bench_generation(args.sides, args.seed),
+               "search":     bench_search(args.sides, args.seed, args.algorithms)}
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file), results, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
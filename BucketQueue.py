@@ -0,0 +1,121 @@
+from __future__ import annotations
+from typing import TypeVar
+
+from Stack import EmptyError
+
+T = TypeVar('T')
+
+class BucketQueue[T]:
+    ''' class to implement a monotone min-priority queue for small integer
+        priorities (Dial's bucket queue): a ring of max_step + 1 lists, one
+        per priority in the window [current, current + max_step], so pushes
+        and pops cost O(1) rather than a heap's O(log n); every pushed
+        priority must lie within that window, which holds for Dijkstra's
+        algorithm when no step costs more than max_step '''
+
+    __slots__ = ("_buckets", "_current", "_size")
+
+    def __init__(self, max_step: int) -> None:
+        ''' BucketQueue initializer method
+        Parameters:
+            max_step: largest amount a pushed priority may exceed the
+                      priority most recently popped
+        Raises:
+            ValueError if max_step is negative
+        '''
+        if max_step < 0:
+            raise ValueError("max_step must not be negative")
+        self._buckets: list[list[T]] = [[] for _ in range(max_step + 1)]
+        self._current: int = 0    # priority of the bucket pops are taken from
+        self._size:    int = 0
+
+    def __len__(self) -> int:
+        ''' Returns:
+            number of items in the bucket queue, as an integer
+        '''
+        return self._size
+
+    def push(self, item: T, priority: int) -> None:
+        ''' pushes an item with the given integer priority; an item pushed
+            twice is simply queued twice (callers skip stale copies)
+        Raises:
+            ValueError if priority is outside the current window
+        '''
+        if not self._current <= priority < self._current + len(self._buckets):
+            raise ValueError(f"priority {priority} is outside the window " \
+                             f"[{self._current}, {self._current + len(self._buckets) - 1}]")
+        self._buckets[priority % len(self._buckets)].append(item)
+        self._size += 1
+
+    def _advance(self) -> list[T]:
+        ''' moves the window forward to the first nonempty bucket
+        Returns:
+            that bucket
+        '''
+        buckets = self._buckets
+        bucket  = buckets[self._current % len(buckets)]
+        while not bucket:
+            self._current += 1
+            bucket = buckets[self._current % len(buckets)]
+        return bucket
+
+    def pop(self) -> T:
+        ''' removes an item with the lowest priority and returns that item
+        Raises:
+            EmptyError exception if the bucket queue is empty
+        '''
+        if self._size == 0:
+            raise EmptyError('Error in BucketQueue.pop(): bucket queue is empty')
+        self._size -= 1
+        return self._advance().pop()
+
+    def top(self) -> T:
+        ''' returns an item with the lowest priority without removing it
+        Raises:
+            EmptyError exception if the bucket queue is empty
+        '''
+        if self._size == 0:
+            raise EmptyError('Error in BucketQueue.top(): bucket queue is empty')
+        return self._advance()[-1]
+
+    def priority(self) -> int:
+        ''' returns the priority of the items popped next (the window's start
+            once it has been moved up to a nonempty bucket) '''
+        if self._size:
+            self._advance()
+        return self._current
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def __str__(self) -> str:
+        ''' creates a string representation of the queued items, lowest
+            priority first, as item:priority pairs
+        '''
+        n = len(self._buckets)
+        lines = (f"{item}:{p}\n" for p in range(self._current, self._current + n) \
+                                  for item in reversed(self._buckets[p % n]))
+        return "--- top ---\n" + "".join(lines) + "--- bot ---"
+
+
+###################
+def main() -> None:
+    bq = BucketQueue[str](max_step=9)
+    for word, priority in [("eight", 8), ("six", 6), ("seven", 7), ("five", 5), ("nine", 9)]:
+        bq.push(word, priority)
+    print(bq)
+
+    priority = bq.priority()
+    print(f"popped {bq.pop()} at priority {priority}")
+    bq.push("fourteen", 14)   # allowed: within 9 of the current priority, 5
+    while not bq.is_empty():
+        print(bq.pop())
+
+    try:
+        bq.pop()
+    except EmptyError as err:
+        print(f"Successfully caught pop from empty queue: {err.message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+from array import array
+
+from Queue import Queue
+
+###########################################################
+class DistanceField:
+    ''' class to hold the result of one single-source breadth-first search
+        over a whole Maze: the number of moves from every open cell to the
+        source, and which way to step to get one move closer; once built, a
+        shortest path from any cell is a walk down the field with no search '''
+    __slots__ = ('_source', '_num_cols', '_distance', '_hop')
+
+    def __init__(self, maze: Maze, source: int) -> None:
+        ''' DistanceField initializer method; runs the search
+        Parameters:
+            maze:   the Maze to measure
+            source: flat grid index every distance is measured to
+        '''
+        moves, steps = maze._moves, maze._steps
+        cols = maze._num_cols
+        size = len(maze._grid)
+
+        # hop codes: 0 means no hop (the source, or unreachable), otherwise
+        # 1 + the position in offsets of the step that moves towards source
+        offsets = (-cols, cols, 1, -1)
+        back    = {step: offsets.index(-step) + 1 for step in offsets}
+
+        distance = array('i', [-1]) * size   # -1 means unreachable
+        hop      = bytearray(size)
+        distance[source] = 0
+
+        queue = Queue(ring=True)
+        queue.push(source)
+        while not queue.isempty():
+            # expand one whole level at a time, so every cell in it shares
+            # the same distance
+            level = queue.pop_many(len(queue))
+            d = distance[level[0]] + 1
+            for index in level:
+                for step in steps[moves[index]]:
+                    candidate = index + step
+                    if distance[candidate] == -1:
+                        distance[candidate] = d
+                        hop[candidate] = back[step]
+                        queue.push(candidate)
+
+        self._source:   int       = source
+        self._num_cols: int       = cols
+        self._distance: array     = distance
+        self._hop:      bytearray = hop
+
+    def __len__(self) -> int:
+        return len(self._hop)
+
+    def nbytes(self) -> int:
+        ''' returns the memory held by the field's arrays, in bytes '''
+        return len(self._distance) * self._distance.itemsize + len(self._hop)
+
+    def getSource(self) -> int: return self._source
+
+    def distance(self, index: int) -> int:
+        ''' returns the number of moves from the cell at index to the source,
+            or -1 if the source cannot be reached from it '''
+        return self._distance[index]
+
+    def pathFrom(self, index: int) -> list[int] | None:
+        ''' walks down the field from the cell at index to the source
+        Returns:
+            list of flat indices from index to the source, both included, or
+            None if the source cannot be reached
+        '''
+        if self._distance[index] == -1:
+            return None
+
+        offsets = (0, -self._num_cols, self._num_cols, 1, -1)
+        hop  = self._hop
+        path = [index]
+        while index != self._source:
+            index += offsets[hop[index]]
+            path.append(index)
+        return path
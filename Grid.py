@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; Grid.moves has a pure-Python path
+    np = None
+
+# direction bits used in the adjacency index built by Grid.moves
+UP    = 1
+DOWN  = 2
+RIGHT = 4
+LEFT  = 8
+
+###########################################################
+class Grid:
+    ''' class to store a rows x cols maze grid in flat, compact arrays
+        rather than as a 2D list of Cell objects; every cell is addressed
+        by its flat index, row * num_cols + col, and its contents are kept
+        as a small integer code (one byte per cell) '''
+    __slots__ = ('_num_rows', '_num_cols', '_contents')
+
+    def __init__(self, num_rows: int, num_cols: int, fill: int = 0) -> None:
+        ''' Grid initializer method
+        Parameters:
+            num_rows: number of rows in the grid
+            num_cols: number of columns in the grid
+            fill:     integer contents code every cell starts out with
+        Raises:
+            ValueError if either dimension is not positive
+        '''
+        if num_rows <= 0 or num_cols <= 0:
+            raise ValueError("grid dimensions must both be positive")
+
+        self._num_rows: int = num_rows
+        self._num_cols: int = num_cols
+        self._contents: bytearray | bytes = bytearray([fill]) * (num_rows * num_cols)
+
+    @classmethod
+    def fromContents(cls, num_rows: int, num_cols: int, contents: bytearray | memoryview) -> Grid:
+        ''' wraps an existing flat buffer of contents codes as a Grid, without
+            copying it; a read-only buffer (such as a memoryview of an mmap)
+            gives an already-frozen Grid
+        Raises:
+            ValueError if contents does not hold num_rows * num_cols codes
+        '''
+        if num_rows <= 0 or num_cols <= 0:
+            raise ValueError("grid dimensions must both be positive")
+        if len(contents) != num_rows * num_cols:
+            raise ValueError(f"expected {num_rows * num_cols} cells, got {len(contents)}")
+
+        grid = cls.__new__(cls)
+        grid._num_rows = num_rows
+        grid._num_cols = num_cols
+        grid._contents = contents
+        return grid
+
+    def __len__(self) -> int:
+        ''' returns the number of cells in the grid '''
+        return len(self._contents)
+
+    def index(self, row: int, col: int) -> int:
+        ''' returns the flat index of the cell at (row, col) '''
+        return row * self._num_cols + col
+
+    def position(self, index: int) -> tuple[int, int]:
+        ''' returns the (row, col) pair for the given flat index '''
+        return divmod(index, self._num_cols)
+
+    def inBounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self._num_rows and 0 <= col < self._num_cols
+
+    def get(self, index: int) -> int:
+        return self._contents[index]
+
+    def set(self, index: int, code: int) -> None:
+        ''' sets the contents code of the cell at index
+        Raises:
+            TypeError if the grid has been frozen
+        '''
+        self._contents[index] = code
+
+    def row(self, row: int) -> bytes:
+        ''' returns a copy of the contents codes for one row of the grid '''
+        start = row * self._num_cols
+        return self._contents[start:start + self._num_cols]
+
+    def freeze(self) -> None:
+        ''' makes the grid read-only, so it can be shared safely between any
+            number of concurrent searches; buffers that are already read-only
+            (bytes, or a memoryview of a read-only mmap) are kept as they are '''
+        if isinstance(self._contents, bytearray):
+            self._contents = bytes(self._contents)
+
+    def moves(self, blocked: int) -> bytes:
+        ''' builds the adjacency index for the grid: one byte per cell whose
+            UP / DOWN / RIGHT / LEFT bits are set for each in-bounds,
+            unblocked neighbour of an unblocked cell; the whole grid is
+            processed at once by treating it as one big integer, one byte
+            per cell, so no per-cell Python work is done
+        Parameters:
+            blocked: the contents code of cells that cannot be entered
+        Returns:
+            bytes of length len(self), indexed like the grid
+        '''
+        if np is not None:
+            return self._numpyMoves(blocked)
+
+        size = len(self._contents)
+        cols = self._num_cols
+
+        # one byte per cell: 1 if the cell is open, 0 if it is blocked
+        table = bytes(0 if code == blocked else 1 for code in range(256))
+        open_ = int.from_bytes(bytes(self._contents).translate(table), 'little')
+
+        # masks that stop right/left moves wrapping onto the next/previous row
+        not_last  = int.from_bytes((b'\x01' * (cols - 1) + b'\x00') * self._num_rows, 'little')
+        not_first = int.from_bytes((b'\x00' + b'\x01' * (cols - 1)) * self._num_rows, 'little')
+
+        # shifting by 8 bits moves every cell's byte over by one column, and
+        # by 8 * cols bits moves it over by one row
+        up    = open_ & (open_ << 8 * cols)
+        down  = open_ & (open_ >> 8 * cols)
+        right = open_ & (open_ >> 8) & not_last
+        left  = open_ & (open_ << 8) & not_first
+
+        mask = up * UP | down * DOWN | right * RIGHT | left * LEFT
+        return (mask & ((1 << 8 * size) - 1)).to_bytes(size, 'little')
+
+    def _numpyMoves(self, blocked: int) -> bytes:
+        ''' the same adjacency index as moves(), computed with NumPy '''
+        open_ = (np.frombuffer(self._contents, dtype=np.uint8) != blocked) \
+                    .reshape(self._num_rows, self._num_cols)
+        mask  = np.zeros(open_.shape, dtype=np.uint8)
+
+        both = open_[1:, :] & open_[:-1, :]   # cell and the cell above it both open
+        mask[1:, :]  |= both * np.uint8(UP)
+        mask[:-1, :] |= both * np.uint8(DOWN)
+        both = open_[:, :-1] & open_[:, 1:]   # cell and the cell right of it both open
+        mask[:, :-1] |= both * np.uint8(RIGHT)
+        mask[:, 1:]  |= both * np.uint8(LEFT)
+        return mask.tobytes()
+
+    def steps(self) -> tuple[tuple[int, ...], ...]:
+        ''' Returns:
+            for every possible moves() byte, the flat index offsets of the
+            neighbours it allows, in up, down, right, left order
+        '''
+        offsets = ((UP, -self._num_cols), (DOWN, self._num_cols), (RIGHT, 1), (LEFT, -1))
+        return tuple(tuple(offset for bit, offset in offsets if mask & bit) for mask in range(16))
@@ -1,10 +1,25 @@
 from __future__ import annotations
+import mmap
+import os
 import random
+import struct
+import sys
+import tempfile
+from array import array
+from collections import OrderedDict
+from threading import Lock
 from enum import Enum
-from typing import NamedTuple
+from typing import Callable, Iterable, Iterator, NamedTuple, TextIO
 
 from Stack import *
 from Queue import *
+from PriorityQueue import PriorityQueue
+from BucketQueue import BucketQueue
+from Grid import Grid, UP, DOWN, RIGHT, LEFT
+from SearchContext import SearchContext
+from SearchStats import SearchStats
+from DistanceField import DistanceField
+import MazeGenerator
 
 ###########################################################
 class Contents(str, Enum):
@@ -30,6 +45,14 @@ class Position(NamedTuple):
 
     def __str__(self) -> str: return f"({self.row},{self.col})"
 
+###########################################################
+class SearchEvent(NamedTuple):
+    ''' named tuple describing one cell expansion, as yielded by the
+        Maze.iter_* searches '''
+    cell:     Position           # the cell taken off the frontier
+    parent:   Position | None    # the cell it was reached from (None for the start)
+    frontier: int                # cells still waiting on the frontier
+
 ###########################################################
 class Cell:
     ''' class that allows us to use Cell as a data type -- 
@@ -59,22 +82,102 @@ class Cell:
     def isBlocked(self) -> bool:  return self._contents == Contents.BLOCKED
     def isGoal(self)    -> bool:  return self._contents == Contents.GOAL
 
-    def __eq__(self, other: Cell) -> bool:
-        return self._position == other._position and \
-               self._contents == other._contents and \
-               self._parent   == other._parent
+    def __eq__(self, other: object) -> bool:
+        ''' two Cells are equal when they are at the same Position, so Cells
+            can be kept in sets and used as dict keys; see sameAs for a full
+            structural comparison '''
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return self._position == other._position
+
+    def __hash__(self) -> int:
+        return hash(self._position)
+
+    def sameAs(self, other: Cell) -> bool:
+        ''' compares two Cells structurally: position and contents, and the
+            same for every Cell along both _parent chains; walks the chains
+            in a loop, so long paths cannot hit the recursion limit '''
+        a, b = self, other
+        while a is not None and b is not None:
+            if a is b:
+                return True   # shared tail of the two chains
+            if a._position != b._position or a._contents != b._contents:
+                return False
+            a, b = a._parent, b._parent
+        return a is None and b is None
     
 
         
+# contents codes stored in the Grid are the positions of the Contents
+# entries in declaration order (EMPTY = 0, START = 1, ...)
+_CONTENTS: list[Contents] = list(Contents)
+_CODE:     dict[Contents, int] = {c: i for i, c in enumerate(_CONTENTS)}
+_GLYPHS:   list[str] = [c.value for c in _CONTENTS]
+
+# str.translate table turning a row of contents codes (decoded as latin-1, one
+# char per code) straight into "|glyph|glyph..." in a single C-level pass
+_ROW_GLYPHS: dict[int, str] = {code: "|" + glyph for code, glyph in enumerate(_GLYPHS)}
+
+# glyphs accepted by Maze.from_text, with the ASCII fallbacks; a drawn path
+# is read back as empty cells
+_TEXT_CODES: dict[str, int] = {
+    Contents.EMPTY.value:   _CODE[Contents.EMPTY],   ".": _CODE[Contents.EMPTY],
+    Contents.PATH.value:    _CODE[Contents.EMPTY],   "*": _CODE[Contents.EMPTY],
+    Contents.START.value:   _CODE[Contents.START],   "S": _CODE[Contents.START],
+    Contents.GOAL.value:    _CODE[Contents.GOAL],    "G": _CODE[Contents.GOAL],
+    Contents.BLOCKED.value: _CODE[Contents.BLOCKED], "X": _CODE[Contents.BLOCKED],
+}
+_VALID_CODES: bytes = bytes(sorted(set(_TEXT_CODES.values())))
+# str.translate table turning a row of glyphs into one char per code, ready
+# to be encoded as latin-1 straight into the grid; characters that are
+# themselves contents codes would otherwise pass through untouched, so they
+# are sent to "?", which is not one
+_PARSE_TABLE: dict[int, str] = {code: "?" for code in _VALID_CODES}
+_PARSE_TABLE.update((ord(glyph), chr(code)) for glyph, code in _TEXT_CODES.items())
+
+# binary maze file layout (see Maze.save): a 64-byte little-endian header
+# of magic, version, flags, rows, cols, start row/col and goal row/col,
+# then one contents code per cell, then (if flagged) one moves byte per cell
+_FILE_MAGIC   = b"MAZE"
+_FILE_VERSION = 1
+_FILE_HEADER  = struct.Struct("<4sHHQQQQQQ")
+_FILE_OFFSET  = 64
+_HAS_MOVES    = 1
+
+# translation table that turns START and GOAL codes into EMPTY ones
+_CLEAR_ENDPOINTS = bytes(_CODE[Contents.EMPTY] if code in (_CODE[Contents.START], _CODE[Contents.GOAL]) \
+                         else code for code in range(256))
+
+# default memory bound on the DistanceFields each Maze keeps cached
+FIELD_CACHE_BYTES: int = 256 * 2**20
+
+# path cost recorded for a cell no search path has reached yet
+_NO_COST = 2**63 - 1
+
+# default cap on the transposition table of the iterative-deepening searches
+DEEPENING_TABLE_SIZE: int = 1 << 16
+
+def _maskContents(blocked) -> bytearray:
+    ''' converts a flat blocked mask (nonzero where blocked) into a bytearray
+        of EMPTY and BLOCKED contents codes '''
+    table = bytearray([_CODE[Contents.BLOCKED]]) * 256
+    table[0] = _CODE[Contents.EMPTY]
+    return bytearray(blocked).translate(table)
+
 ###########################################################
 class Maze:
-    __slots__ = ('_num_rows', '_num_cols', '_start', '_goal', '_grid')
+    __slots__ = ('_num_rows', '_num_cols', '_start', '_goal', '_grid', \
+                 '_start_index', '_goal_index', '_starts', '_goals', '_endpoints', \
+                 '_moves', '_steps', '_costs', '_components', '_base', \
+                 '_fields', '_fields_limit', '_fields_lock', '_marks')
 
     def __init__(self, num_rows: int = 10, num_cols: int = 10, \
                        start: Position = Position(0,0), \
                        goal:  Position = Position(9,9), \
                        proportion_blocked: float = 0.2, \
-                       debug: bool = False) -> None:
+                       debug: bool = False, \
+                       seed: int | None = None, \
+                       solvable: bool = False) -> None:
         ''' Maze initializer method
         Parameters:
             num_rows:           number of rows in the grid
@@ -83,6 +186,8 @@ class Maze:
             goal:               Position object indicating (row,col) of the goal cell
             proportion_blocked: proportion of cells to be blocked (between 0.0 and 1.0)
             debug:              whether to use one of the Maze examples from slides
+            seed:               seed for the random blocking, for repeatable mazes
+            solvable:           whether to keep a random start-to-goal path open
         Raises:
             TypeError if proportion_blocked is not float
             TypeError if start of goal is not Position
@@ -100,43 +205,310 @@ class Maze:
             start = Position(5, 0)
             goal  = Position(0, 4)
 
-        self._num_rows: int  = num_rows
-        self._num_cols: int  = num_cols
-
-        # set up the start and goal Cell objects
-        self._start: Cell = Cell(start.row, start.col, Contents.START)
-        self._goal:  Cell = Cell(goal.row,  goal.col,  Contents.GOAL)
-
-        # create a 2D list of Cell objects, all initially empty
-        self._grid: list[ list[Cell] ] = \
-            [ [Cell(r,c, Contents.EMPTY) for c in range(num_cols)] \
-              for r in range(num_rows) ]
-
-        # overwrite the appropriate locations with the start and goal Cells
-        self._grid[start.row][start.col] = self._start
-        self._grid[goal.row][goal.col]   = self._goal
-
+        # flat grid of contents codes; Cell objects are only created on
+        # demand (see _cell)
         if debug:
+            grid = Grid(num_rows, num_cols, _CODE[Contents.EMPTY])
             # for example from slides
             blocked_cells = [(1,0),(1,3),(2,1),(2,4),(3,2),(5,1),(5,3),(5,4)]
             for pos in blocked_cells:
                 p = Position(*pos)  # expand the pos tuple & pass to Position. the * before something itterable breaks it down to individula arguments 
-                self._grid[p.row][p.col]._contents = Contents.BLOCKED
+                grid.set(grid.index(p.row, p.col), _CODE[Contents.BLOCKED])
         else:
             # put blocks at random spots in the grid, using given proportion
+            blocked = MazeGenerator.random_blocked(num_rows, num_cols, start, goal, \
+                                                   proportion_blocked, seed, solvable)
+            grid = Grid.fromContents(num_rows, num_cols, _maskContents(blocked))
 
-            options: list[Cell] = [cell for row in self._grid for cell in row]
+        self._attach(grid, start, goal)
 
-            options.remove(self._start)
-            options.remove(self._goal)
+    def _attach(self, grid: Grid, start: Position, goal: Position, moves = None) -> None:
+        ''' takes ownership of a filled-in grid: writes the start and goal
+            codes into it, freezes it and builds the adjacency index
+        Parameters:
+            grid:  Grid of contents codes; it only has to be writable if the
+                   start and goal codes are not already in place
+            start: Position of the start cell
+            goal:  Position of the goal cell
+            moves: optional precomputed adjacency index (see Grid.moves)
+        Raises:
+            ValueError if start or goal is outside the grid
+        '''
+        if not grid.inBounds(start.row, start.col) or not grid.inBounds(goal.row, goal.col):
+            raise ValueError("start and goal must both be inside the grid")
 
-            how_many:int = int((num_rows * num_cols -2) * proportion_blocked)
+        self._num_rows: int  = grid._num_rows
+        self._num_cols: int  = grid._num_cols
+        self._grid:     Grid = grid
 
-            blocked: list[Cell] = random.sample(options,k= how_many) #radnom selction of cells to block from our 1d list of cells
+        # set up the start and goal Cell objects
+        self._start: Cell = Cell(start.row, start.col, Contents.START)
+        self._goal:  Cell = Cell(goal.row,  goal.col,  Contents.GOAL)
 
-            for cell in blocked:
-                cell._contents = Contents.BLOCKED #this only chnages the grid data becuase the cell class is mutable. blcoked and grid point to same memeory address, to changing things in blocked chnages things in grid becuase they are pointing at the same things we are ultamtley changin. which is the object at a memory address both point ot the same memeory address
-            pass
+        # overwrite the appropriate locations with the start and goal codes
+        self._start_index: int = grid.index(start.row, start.col)
+        self._goal_index:  int = grid.index(goal.row,  goal.col)
+        if grid.get(self._start_index) != _CODE[Contents.START]:
+            grid.set(self._start_index, _CODE[Contents.START])
+        if grid.get(self._goal_index) != _CODE[Contents.GOAL]:
+            grid.set(self._goal_index, _CODE[Contents.GOAL])
+
+        # every start and goal, by flat index; a Maze built here has one of
+        # each, but a view from withEndpointSets can hold any number
+        self._starts:    tuple[int, ...]     = (self._start_index,)
+        self._goals:     tuple[int, ...]     = (self._goal_index,)
+        self._endpoints: dict[int, Contents] = {self._start_index: Contents.START, \
+                                                self._goal_index:  Contents.GOAL}
+
+        # the grid never changes after this point; all search state lives in
+        # a SearchContext, so one Maze can serve many searches at once
+        grid.freeze()
+
+        # adjacency index, built once: _moves holds each cell's open
+        # directions as bits, and _steps maps those bits to index offsets
+        self._moves: bytes = grid.moves(_CODE[Contents.BLOCKED]) if moves is None else moves
+        self._steps: tuple[tuple[int, ...], ...] = grid.steps()
+
+        # per-cell cost of moving into each cell, one byte per cell; None
+        # means every move costs 1 (see withCosts)
+        self._costs: bytes | None = None
+
+        # connected-component labels, built on first use by _labels()
+        self._components: array | None = None
+
+        # the Maze a view was made from (None for a Maze that is not a view)
+        self._base: Maze | None = None
+
+        # (index, code) pairs drawn over the grid when rendering; only a view
+        # from withEndpoints needs any, to move the start and goal glyphs
+        self._marks: tuple[tuple[int, int], ...] = ()
+
+        # least-recently-used cache of DistanceFields, keyed by source Position
+        self._fields:       OrderedDict[Position, DistanceField] = OrderedDict()
+        self._fields_limit: int  = FIELD_CACHE_BYTES
+        self._fields_lock:  Lock = Lock()
+
+    @classmethod
+    def _fromMask(cls, num_rows: int, num_cols: int, start: Position, goal: Position, \
+                       blocked) -> Maze:
+        ''' builds a Maze straight from a flat blocked mask, without going
+            through the random generation in __init__
+        Parameters:
+            blocked: bytes-like object of num_rows * num_cols bytes, nonzero
+                     where the cell is blocked
+        Returns:
+            the new Maze
+        '''
+        maze = cls.__new__(cls)
+        maze._attach(Grid.fromContents(num_rows, num_cols, _maskContents(blocked)), start, goal)
+        return maze
+
+    @classmethod
+    def generate(cls, num_rows: int, num_cols: int, \
+                      start: Position | None = None, goal: Position | None = None, \
+                      proportion_blocked: float = 0.2, seed: int | None = None, \
+                      method: str = "numpy", solvable: bool = False) -> Maze:
+        ''' builds a random Maze from an explicit seed, so the same arguments
+            always give the same maze
+        Parameters:
+            num_rows:           number of rows in the grid
+            num_cols:           number of columns in the grid
+            start:              Position of the start cell (default top-left)
+            goal:               Position of the goal cell (default bottom-right)
+            proportion_blocked: proportion of cells to block, for the
+                                "numpy" and "random" methods
+            seed:               seed for the random number generator
+            method:             one of
+                                  "numpy":       each cell blocked independently with
+                                                 probability proportion_blocked, drawn
+                                                 in vectorized chunks (needs NumPy)
+                                  "random":      exactly the same number of blocked
+                                                 cells as Maze(), in pure Python
+                                  "backtracker", "prim", "kruskal":
+                                                 perfect mazes (one route between any
+                                                 two rooms, the cells at even row and
+                                                 column) from those algorithms; a
+                                                 start or goal off that lattice may
+                                                 have to add a loop to be joined in
+            solvable:           for "numpy" and "random", whether to carve a random
+                                start-to-goal path first and keep it open; perfect
+                                mazes are always solvable
+        Returns:
+            the new Maze; its start and goal are always open
+        Raises:
+            ImportError if method is "numpy" and NumPy is not installed
+            ValueError if proportion_blocked is outside [0,1] or method is unknown
+        '''
+        if proportion_blocked < 0 or proportion_blocked > 1:
+            raise ValueError("proportion_blocked argument must be a float b/w 0 and 1")
+        if start is None: start = Position(0, 0)
+        if goal  is None: goal  = Position(num_rows - 1, num_cols - 1)
+
+        if method == "numpy":
+            blocked = MazeGenerator.numpy_blocked(num_rows, num_cols, proportion_blocked, seed)
+            if solvable:
+                for index in MazeGenerator.carve_path(num_rows, num_cols, start, goal, random.Random(seed)):
+                    blocked[index] = 0
+        elif method == "random":
+            blocked = MazeGenerator.random_blocked(num_rows, num_cols, start, goal, \
+                                                   proportion_blocked, seed, solvable)
+        elif method in ("backtracker", "prim", "kruskal"):
+            blocked = getattr(MazeGenerator, method)(num_rows, num_cols, start, goal, seed)
+        else:
+            raise ValueError(f"unknown maze generation method: {method}")
+
+        return cls._fromMask(num_rows, num_cols, start, goal, blocked)
+
+    def save(self, path: str) -> None:
+        ''' writes the Maze to a compact binary file: a small header with the
+            dimensions, start and goal, then one contents code per cell, then
+            the adjacency index, so load() has nothing to recompute; a view
+            from withEndpoints is saved with its own start and goal baked
+            into the contents (of a withEndpointSets view, only the first
+            start and goal are kept)
+        Parameters:
+            path: name of the file to write
+        '''
+        contents = self._grid._contents
+        if self._marks:
+            # a view: clear the grid's own start and goal, and bake in the view's
+            contents = bytearray(contents)
+            for index, code in self._marks[:2]:
+                contents[index] = code
+            contents[self._start_index] = _CODE[Contents.START]
+            contents[self._goal_index]  = _CODE[Contents.GOAL]
+
+        # write a new file and rename it over path, rather than truncating
+        # path in place: any Maze still mapped from the old file (this one,
+        # if it was loaded from path) keeps its own inode
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                header = _FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, _HAS_MOVES, \
+                                           self._num_rows, self._num_cols, \
+                                           *self._start._position, *self._goal._position)
+                file.write(header.ljust(_FILE_OFFSET, b"\0"))
+                file.write(contents)
+                file.write(self._moves)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Maze:
+        ''' opens a Maze written by save() by memory-mapping the file read-only
+            rather than reading it; the grid pages in lazily as it is
+            touched, and every process that loads the same file shares the
+            same physical pages
+        Parameters:
+            path: name of the file to open
+        Returns:
+            the Maze, whose grid is backed by the mapped file
+        Raises:
+            ValueError if the file is not a maze file or is truncated
+        '''
+        with open(path, "rb") as file:
+            # the mapping stays valid after the file is closed
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapped) < _FILE_OFFSET:
+            raise ValueError(f"{path} is too short to be a maze file")
+        magic, version, flags, num_rows, num_cols, start_row, start_col, goal_row, goal_col = \
+            _FILE_HEADER.unpack_from(mapped, 0)
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            raise ValueError(f"{path} is not a version {_FILE_VERSION} maze file")
+
+        size = num_rows * num_cols
+        end  = _FILE_OFFSET + (2 if flags & _HAS_MOVES else 1) * size
+        if len(mapped) < end:
+            raise ValueError(f"{path} is truncated: expected {end} bytes, found {len(mapped)}")
+
+        view     = memoryview(mapped)
+        contents = view[_FILE_OFFSET:_FILE_OFFSET + size]
+        moves    = view[_FILE_OFFSET + size:end] if flags & _HAS_MOVES else None
+
+        # the mapping is read-only, so if the start and goal codes are not
+        # where the header says (a view saved before they were baked in), the
+        # contents are fixed up in a private copy instead
+        start = num_cols * start_row + start_col
+        goal  = num_cols * goal_row  + goal_col
+        if start >= size or goal >= size or \
+           contents[start] != _CODE[Contents.START] or contents[goal] != _CODE[Contents.GOAL]:
+            contents = bytearray(contents).translate(_CLEAR_ENDPOINTS)
+        grid = Grid.fromContents(num_rows, num_cols, contents)
+
+        maze = cls.__new__(cls)
+        maze._attach(grid, Position(start_row, start_col), Position(goal_row, goal_col), moves)
+        return maze
+
+    @classmethod
+    def from_text(cls, lines: Iterable[str]) -> Maze:
+        ''' builds a Maze from text, one row per line, parsing the lines one at
+            a time straight into the grid's contents codes; rows may be drawn
+            as Maze.__str__ draws them ("|◎| |░|") or as one glyph per cell
+            ("◎ ░"), using the Contents glyphs or the ASCII fallbacks S, G, X
+            (and "." for empty); a drawn path ("★" or "*") reads as empty
+        Parameters:
+            lines: any iterable of lines, such as an open text file
+        Returns:
+            the new Maze
+        Raises:
+            ValueError if rows differ in width, a glyph is not recognised, or
+                there is not exactly one start and one goal
+        '''
+        contents = bytearray()
+        num_rows = num_cols = 0
+        found: dict[int, Position] = {}   # contents code -> where the start / goal is
+
+        for number, line in enumerate(lines, 1):
+            line = line.rstrip("\r\n")
+            if not line:
+                continue   # e.g. a trailing blank line
+            if line[0] == "|":
+                if line[0::2].strip("|"):
+                    raise ValueError(f"line {number}: cells must be delimited by '|'")
+                line = line[1::2]
+
+            row = line.translate(_PARSE_TABLE).encode("latin-1", errors="replace")
+            if row.translate(None, _VALID_CODES):
+                raise ValueError(f"line {number}: unrecognised glyph in {line!r}")
+            if num_rows == 0:
+                num_cols = len(row)
+            elif len(row) != num_cols:
+                raise ValueError(f"line {number}: row has {len(row)} cells, expected {num_cols}")
+
+            for code in (_CODE[Contents.START], _CODE[Contents.GOAL]):
+                count = row.count(code)
+                if count > 1 or (count and code in found):
+                    raise ValueError(f"line {number}: more than one {_CONTENTS[code].name.lower()} cell")
+                if count:
+                    found[code] = Position(num_rows, row.index(code))
+
+            contents += row
+            num_rows += 1
+
+        start = found.get(_CODE[Contents.START])
+        goal  = found.get(_CODE[Contents.GOAL])
+        if start is None or goal is None:
+            raise ValueError("maze text must contain exactly one start and one goal")
+
+        maze = cls.__new__(cls)
+        maze._attach(Grid.fromContents(num_rows, num_cols, contents), start, goal)
+        return maze
+
+    @classmethod
+    def from_file(cls, path: str, encoding: str = "utf-8") -> Maze:
+        ''' builds a Maze from a text file, streaming it line by line (see
+            from_text)
+        Parameters:
+            path:     name of the file to read
+            encoding: the file's text encoding
+        Returns:
+            the new Maze
+        '''
+        with open(path, encoding=encoding) as file:
+            return cls.from_text(file)
 
     def __str__(self) -> str:
         ''' creates a str version of the Maze, showing contents, with cells
@@ -144,193 +516,1242 @@ class Maze:
         Returns:
             a str representation of the Maze
         '''
-        maze_str = ""
-        for row in self._grid:  # row : list[Cell]
-            maze_str += "|" + "|".join([cell._contents for cell in row]) + "|\n"
-        return maze_str[:-1]  # remove the final \n
-    
-
+        return self.render()
 
-    def getStart(self) -> Cell: return self._start 
-
-    def getGoal(self) -> Cell: return self._goal
-
-
-    def showPath(self: Maze, goal: Cell) -> None:
-        path =[]
+    def _rows(self, path: list[int], top: int, bottom: int, left: int, right: int) -> Iterator[str]:
+        ''' renders rows top..bottom-1, columns left..right-1, of the Maze one
+            row at a time, with the given cells drawn as part of a path; only
+            the rows the path touches are copied, and the grid is untouched
+        Parameters:
+            path: flat indices of the cells to draw as Contents.PATH
+        Yields:
+            one str per row, cells delimited by vertical pipes
+        '''
+        cols = self._num_cols
+        path_code = _CODE[Contents.PATH]
+        by_row: dict[int, list[tuple[int, int]]] = {}
+        for index, code in [*self._marks, *((index, path_code) for index in path)]:
+            row, col = divmod(index, cols)
+            by_row.setdefault(row, []).append((col, code))
+
+        contents = self._grid._contents
+        for r in range(top, bottom):
+            row = bytearray(contents[r*cols + left : r*cols + right])
+            for c, code in by_row.get(r, ()):
+                if left <= c < right:
+                    row[c - left] = code
+            yield row.decode('latin-1').translate(_ROW_GLYPHS) + "|"
+
+    def _pathIndices(self, goal: Cell) -> list[int]:
+        ''' follows a Cell's _parent chain back to a start
+        Returns:
+            flat indices of the cells on the path, goal first
+        Raises:
+            ValueError if the chain does not lead back to a start
+        '''
+        path = []
         cell = goal
-        while cell._parent is not None:
-            path.append(cell)
+        while cell is not None:
+            path.append(self._index(cell))
             cell = cell._parent
+        if path[-1] not in self._starts:
+            raise ValueError("path does not lead back to the start")
+        return path
+
+    def render(self, goal: Cell | None = None, file: TextIO | None = None, \
+                     margin: int | None = None) -> str | None:
+        ''' renders the Maze, optionally with a path drawn over it, in one pass
+            over the rows; the grid itself is never modified
+        Parameters:
+            goal:   optional Cell whose _parent chain gives the path to draw
+            file:   optional text file object; if given, rows are written to it
+                    one at a time instead of being joined into one str
+            margin: if given (with a goal), only the rectangle around the path
+                    widened by margin cells on every side is rendered
+        Returns:
+            the rendered str, or None if it was written to file
+        Raises:
+            ValueError if goal's _parent chain does not lead back to the start
+        '''
+        path = [] if goal is None else self._pathIndices(goal)
+        top, bottom, left, right = 0, self._num_rows, 0, self._num_cols
+        if path and margin is not None:
+            rows = [index // self._num_cols for index in path]
+            cols = [index %  self._num_cols for index in path]
+            top    = max(0, min(rows) - margin)
+            bottom = min(self._num_rows, max(rows) + margin + 1)
+            left   = max(0, min(cols) - margin)
+            right  = min(self._num_cols, max(cols) + margin + 1)
+
+        # starts and goals keep their own glyphs
+        endpoints = self._endpoints
+        path = [index for index in path if index not in endpoints]
+        rows = self._rows(path, top, bottom, left, right)
+        if file is None:
+            return "\n".join(rows)
+        for row in rows:
+            file.write(row)
+            file.write("\n")
+        return None
+
+    def _cell(self, index: int) -> Cell:
+        ''' creates a new Cell on demand for the given flat grid index '''
+        row, col = self._grid.position(index)
+        contents = self._endpoints.get(index)
+        if contents is not None:
+            return Cell(row, col, contents)
+
+        contents = _CONTENTS[self._grid.get(index)]
+        if contents is Contents.START or contents is Contents.GOAL:
+            contents = Contents.EMPTY   # the grid's own endpoints, in a withEndpoints view
+        return Cell(row, col, contents)
+
+    def _view(self) -> Maze:
+        ''' returns a shallow copy of this Maze for withEndpointSets or
+            withCosts to adjust; it shares every slot, and refers back to the
+            original Maze so lazily built state such as the component labels
+            is built once, on the original, for all its views '''
+        view = Maze.__new__(type(self))
+        for name in Maze.__slots__:
+            setattr(view, name, getattr(self, name))
+        view._base = self._base if self._base is not None else self
+        return view
+
+    def withEndpoints(self, start: Position, goal: Position) -> Maze:
+        ''' returns a view of this Maze that searches between different start
+            and goal cells; the view shares the grid, adjacency index and
+            component labels rather than copying them, so it is cheap to make
+            one per query
+        Parameters:
+            start: Position of the view's start cell
+            goal:  Position of the view's goal cell
+        Returns:
+            the new Maze view
+        Raises:
+            ValueError if start or goal is outside the grid or blocked
+        '''
+        return self.withEndpointSets((start,), (goal,))
 
-        path.append(cell)
-        assert(cell == self._start)
-
-        path.reverse()
-
-        for cell in path:
-            if cell not in [self._goal, self._start]:
-                cell.markOnPath()
-
-        print(self) #pirnting newly marked up maze with the path shown 
-
-    def getSearchLocations(self, cell: Cell)-> list[Cell]:
-        current_cell = cell.getPosition()
-        res = []
-        res.append(self._grid[current_cell.row-1][current_cell.col])
-        res.append(self._grid[current_cell.row+1][current_cell.col])
-        res.append(self._grid[current_cell.row][current_cell.col+1])
-        res.append(self._grid[current_cell.row][current_cell.col-1]) 
+    def withEndpointSets(self, starts: Iterable[Position], goals: Iterable[Position]) -> Maze:
+        ''' returns a view of this Maze (see withEndpoints) holding any number
+            of start and goal cells; the first of each becomes the view's
+            getStart() and getGoal(), which the single-pair searches use,
+            while nearest_goals and nearest_starts use them all
+        Parameters:
+            starts: Positions of the view's start cells
+            goals:  Positions of the view's goal cells
+        Returns:
+            the new Maze view
+        Raises:
+            ValueError if either is empty, or any position is outside the
+                grid or blocked
+        '''
+        grid   = self._grid
+        starts = tuple(starts)
+        goals  = tuple(goals)
+        if not starts or not goals:
+            raise ValueError("there must be at least one start and one goal")
+        for pos in starts + goals:
+            if not grid.inBounds(pos.row, pos.col):
+                raise ValueError("start and goal must both be inside the grid")
+            if grid.get(grid.index(pos.row, pos.col)) == _CODE[Contents.BLOCKED]:
+                raise ValueError("start and goal must not be blocked cells")
+
+        view = self._view()
+
+        view._start = Cell(starts[0].row, starts[0].col, Contents.START)
+        view._goal  = Cell(goals[0].row,  goals[0].col,  Contents.GOAL)
+        view._starts = tuple(grid.index(pos.row, pos.col) for pos in starts)
+        view._goals  = tuple(grid.index(pos.row, pos.col) for pos in goals)
+        view._start_index = view._starts[0]
+        view._goal_index  = view._goals[0]
+        view._endpoints = {index: Contents.START for index in view._starts}
+        view._endpoints.update((index, Contents.GOAL) for index in view._goals)
+
+        # distance fields are keyed by source, so the cache could be shared,
+        # but a separate one keeps each view's memory bound its own
+        view._fields      = OrderedDict()
+        view._fields_lock = Lock()
+
+        # draw the grid's own start and goal as empty, and the view's in place
+        baked = self._marks[:2] if self._marks else \
+                ((self._start_index, _CODE[Contents.EMPTY]), (self._goal_index, _CODE[Contents.EMPTY]))
+        view._marks = (*baked, *((index, _CODE[contents]) for index, contents in view._endpoints.items()))
+        return view
+
+    def withCosts(self, costs) -> Maze:
+        ''' returns a view of this Maze (sharing its grid, like withEndpoints)
+            on weighted terrain, where moving into a cell costs that cell's
+            entry in costs rather than 1; dijkstra_search and dial_search
+            find cheapest paths over it
+        Parameters:
+            costs: bytes-like object or iterable of one integer cost from 0
+                   to 255 per cell, indexed like the grid (for example from
+                   MazeGenerator.terrain_costs)
+        Returns:
+            the new Maze view
+        Raises:
+            ValueError if costs has the wrong length or a cost out of range
+        '''
+        try:
+            costs = bytes(costs)
+        except ValueError:
+            raise ValueError("costs must all be between 0 and 255") from None
+        if len(costs) != len(self._grid):
+            raise ValueError(f"expected {len(self._grid)} costs, got {len(costs)}")
+
+        view = self._view()
+        view._costs = costs
+        return view
+
+    def getCost(self, position: Position) -> int:
+        ''' returns the cost of moving into the cell at position '''
+        return 1 if self._costs is None else self._costs[self._grid.index(position.row, position.col)]
+
+    def pathCost(self, goal: Cell) -> int:
+        ''' returns the total cost of the path ending at goal: the cost of
+            every cell moved into, so the start's own cost is not counted
+        Raises:
+            ValueError if goal's _parent chain does not lead back to a start
+        '''
+        path = self._pathIndices(goal)
+        if self._costs is None:
+            return len(path) - 1
+        return sum(self._costs[index] for index in path[:-1])
+
+    def _index(self, cell: Cell) -> int:
+        ''' returns the flat grid index of the given Cell '''
+        return self._grid.index(cell._position.row, cell._position.col)
+
+    def _chain(self, path: list[int]) -> Cell:
+        ''' builds fresh Cell objects for a path of flat indices, each one's
+            _parent set to the Cell before it
+        Returns:
+            the Cell for the last index, with its _parent chain leading back
+            to the first
+        '''
+        prev = None
+        for i in path:
+            cell = self._cell(i)
+            cell._parent = prev
+            prev = cell
+        return prev
+
+    def _pathTo(self, context: SearchContext, index: int) -> Cell:
+        ''' builds fresh Cell objects along the parent chain recorded in the
+            search context, from the start down to the given index
+        Returns:
+            the Cell at index, with its _parent chain leading back to the start
+        '''
+        stats = context._stats
+        if stats is None:
+            return self._chain(context.pathTo(index))
+        with stats.phase("path"):
+            return self._chain(context.pathTo(index))
 
+    def getStart(self) -> Cell: return self._start 
 
-        
-        for cell in res: #checking for seen cells and blocked cells
-            if cell._seen == True or cell.isBlocked == True :
-                res.remove(cell)
+    def getGoal(self) -> Cell: return self._goal
 
+    def getStarts(self) -> list[Cell]: return [self._cell(index) for index in self._starts]
 
-        for cell in res:
-            if cell._position.row < 0 or  cell._position.col < 0:
-                res.remove(cell)
-                ### above and below are bounds checks to see if we hit a wall
-        for cell in res:
-            if cell._position.row > self._num_rows or  cell._position.col < self._num_cols:
-                res.remove(cell)
+    def getGoals(self) -> list[Cell]: return [self._cell(index) for index in self._goals]
 
 
+    def showPath(self: Maze, goal: Cell, file: TextIO | None = None, \
+                       margin: int | None = None, stats: SearchStats | None = None) -> None:
+        ''' prints the Maze with the path ending at goal drawn over it, marking
+            the path's Cells as Contents.PATH
+        Parameters:
+            goal:   Cell whose _parent chain leads back to the start
+            file:   text file object to write to (default sys.stdout)
+            margin: if given, crop to the path's surroundings (see render)
+            stats:  optional SearchStats to time this under the "showPath" phase
+        '''
+        if stats is not None:
+            with stats.phase("showPath"):
+                return self.showPath(goal, file, margin)
 
-        return res
+        cell = goal._parent
+        while cell is not None and cell._parent is not None:
+            cell.markOnPath()
+            cell = cell._parent
 
+        #pirnting the maze with the path drawn over it, streamed row by row
+        self.render(goal, file if file is not None else sys.stdout, margin)
 
-    def depth_first_search(self) -> Cell | None:
-        #adding cells to the stack in clockwise order, starting from upCell
-        #last cell to be added is the chosen cell
-        #the chosen cell's contents are updated to path and 
+    def _neighbours(self, index: int) -> list[int]:
+        ''' finds the in-bounds, unblocked neighbours of a cell, in up, down,
+            right, left order, from the precomputed adjacency index
+        Parameters:
+            index: flat grid index of the cell being expanded
+        Returns:
+            list of flat grid indices
+        '''
+        return [index + step for step in self._steps[self._moves[index]]]
 
+    def _searchLocations(self, index: int, context: SearchContext) -> list[int]:
+        ''' finds the in-bounds, unblocked neighbours of a cell that the given
+            search has not seen yet, in up, down, right, left order
+        Parameters:
+            index:   flat grid index of the cell being expanded
+            context: the search whose seen cells should be skipped
+        Returns:
+            list of flat grid indices
+        '''
+        seen = context._seen
+        return [n for n in self._neighbours(index) if not seen[n]]
 
-        stack = Stack()
-        stack.push(self._start) 
+    def newContext(self, stats: SearchStats | None = None) -> SearchContext:
+        ''' creates fresh search state sized for this Maze, optionally
+            instrumented with the given SearchStats '''
+        return SearchContext(len(self._grid), stats)
 
-        self._start._seen = True
-   
+    def getSearchLocations(self, cell: Cell, context: SearchContext | None = None)-> list[Cell]:
+        ''' finds the cells a search could move to next from the given cell
+        Parameters:
+            cell:    the Cell being expanded
+            context: optional search state; cells it has seen are skipped
+        Returns:
+            list of in-bounds, unblocked, not-yet-seen neighbouring Cells
+        '''
+        if context is None: context = self.newContext()
+        if context._stats is not None:
+            with context._stats.phase("getSearchLocations"):
+                return [self._cell(n) for n in self._searchLocations(self._index(cell), context)]
+        return [self._cell(n) for n in self._searchLocations(self._index(cell), context)]
 
-        while stack.is_empty==False: 
-            cell = stack.pop()
 
+    def depth_first_search(self, context: SearchContext | None = None) -> Cell | None:
+        ''' searches from the start for the goal, always expanding the most
+            recently discovered cell next
+        Parameters:
+            context: optional fresh SearchContext to record the search in; one
+                     is created if not given
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal = self._goal_index
+        moves, steps, seen = self._moves, self._steps, context._seen
 
-            if cell.isGoal():
-                self.showPath(cell)
+        stack = context.frontier(Stack[int](strict=False))
+        stack.push(self._start_index)
+        context.visit(self._start_index)
 
+        while not stack.is_empty():
+            index = stack.pop()
+            context._expanded += 1
 
-            candidates: list[Cell] = self.getSearchLocations(cell)
+            if index == goal:
+                return self._pathTo(context, index)
 
-            for candidate in candidates:
+            for step in steps[moves[index]]:
+                candidate = index + step
+                if seen[candidate]: continue
                 stack.push(candidate)
-                candidate._parent = cell
- 
-                candidate._seen=True
-                
+                context.visit(candidate, index)
 
-                #should return the cell that is the goal
+        return None
 
+    def breadth_first_search(self, context: SearchContext | None = None) -> Cell | None:
+        ''' searches outward from the start, level by level, so the first
+            path found to the goal is a shortest one; cells are marked seen
+            as they are queued, so each open cell is queued at most once
+        Parameters:
+            context: optional fresh SearchContext to record the search in; one
+                     is created if not given
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal = self._goal_index
+        moves, steps, seen = self._moves, self._steps, context._seen
+
+        queue = context.frontier(Queue(ring=True))
+        queue.push(self._start_index)
+        context.visit(self._start_index)
+
+        while not queue.isempty():
+            index = queue.pop()
+            context._expanded += 1
+
+            if index == goal:
+                return self._pathTo(context, index)
+
+            for step in steps[moves[index]]:
+                candidate = index + step
+                if seen[candidate]: continue
+                queue.push(candidate)
+                context.visit(candidate, index)
+
+        return None
+
+    def _event(self, context: SearchContext, index: int, frontier: int) -> SearchEvent:
+        ''' builds the SearchEvent for expanding the cell at index '''
+        parent = context._parent[index]
+        return SearchEvent(Position(*self._grid.position(index)), \
+                           None if parent == -1 else Position(*self._grid.position(parent)), \
+                           frontier)
+
+    def iter_dfs(self, context: SearchContext | None = None) -> Iterator[SearchEvent]:
+        ''' depth_first_search as a generator, yielding a SearchEvent as each
+            cell is expanded; nothing is buffered, so the caller can time-slice
+            the search, stop after any number of expansions by simply not
+            asking for more, or stream the events elsewhere
+        Parameters:
+            context: optional fresh SearchContext to record the search in
+        Yields:
+            one SearchEvent per expanded cell, the goal's last
+        Returns:
+            (as StopIteration.value) the goal Cell with its _parent chain, or
+            None if the goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal = self._goal_index
+        moves, steps, seen = self._moves, self._steps, context._seen
 
-            return cell
-
+        stack = context.frontier(Stack[int](strict=False))
+        stack.push(self._start_index)
+        context.visit(self._start_index)
 
-                
+        while not stack.is_empty():
+            index = stack.pop()
+            context._expanded += 1
+            yield self._event(context, index, len(stack))
 
-       
+            if index == goal:
+                return self._pathTo(context, index)
 
-        """ for cell in self._grid:
-            candidates = self.getSearchLocations(cell)
-            for candidate in candidates:
+            for step in steps[moves[index]]:
+                candidate = index + step
+                if seen[candidate]: continue
                 stack.push(candidate)
+                context.visit(candidate, index)
 
-            next_cell = stack.pop()
-            next_cell._parent = cell"""
-
-
-        
-
-        
-    
-        
+        return None
 
+    def iter_bfs(self, context: SearchContext | None = None) -> Iterator[SearchEvent]:
+        ''' breadth_first_search as a generator, yielding a SearchEvent as each
+            cell is expanded (see iter_dfs)
+        Parameters:
+            context: optional fresh SearchContext to record the search in
+        Yields:
+            one SearchEvent per expanded cell, the goal's last
+        Returns:
+            (as StopIteration.value) the goal Cell with its _parent chain, or
+            None if the goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal = self._goal_index
+        moves, steps, seen = self._moves, self._steps, context._seen
+
+        queue = context.frontier(Queue(ring=True))
+        queue.push(self._start_index)
+        context.visit(self._start_index)
+
+        while not queue.isempty():
+            index = queue.pop()
+            context._expanded += 1
+            yield self._event(context, index, len(queue))
+
+            if index == goal:
+                return self._pathTo(context, index)
+
+            for step in steps[moves[index]]:
+                candidate = index + step
+                if seen[candidate]: continue
+                queue.push(candidate)
+                context.visit(candidate, index)
+
+        return None
+
+    def bidirectional_search(self, context:      SearchContext | None = None, \
+                                   goal_context: SearchContext | None = None) -> Cell | None:
+        ''' breadth-first search run from both the start and the goal at once;
+            each round expands one whole level of whichever frontier is
+            smaller, and the search stops as soon as a cell reached from one
+            side has already been seen from the other, so on open grids far
+            fewer cells are expanded than by a one-sided search
+        Parameters:
+            context:      optional fresh SearchContext for the half of the
+                          search rooted at the start
+            goal_context: optional fresh SearchContext for the half of the
+                          search rooted at the goal
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        if context is None:      context      = self.newContext()
+        if goal_context is None: goal_context = self.newContext(context._stats)
+        moves, steps = self._moves, self._steps
+
+        context.visit(self._start_index)
+        goal_context.visit(self._goal_index)
+        if self._start_index == self._goal_index:
+            return self._pathTo(context, self._start_index)
+
+        forward = context.frontier(Queue(ring=True)); forward.push(self._start_index)
+        reverse = context.frontier(Queue(ring=True)); reverse.push(self._goal_index)
+
+        while not forward.isempty() and not reverse.isempty():
+            if len(forward) <= len(reverse):
+                queue, ours, theirs = forward, context, goal_context
+            else:
+                queue, ours, theirs = reverse, goal_context, context
+
+            for index in queue.pop_many(len(queue)):
+                ours._expanded += 1
+                seen = ours._seen
+                for step in steps[moves[index]]:
+                    candidate = index + step
+                    if seen[candidate]: continue
+                    ours.visit(candidate, index)
+                    if theirs._seen[candidate]:
+                        return self._joinPaths(context, goal_context, candidate)
+                    queue.push(candidate)
+
+        return None
+
+    def _joinPaths(self, context: SearchContext, goal_context: SearchContext, meet: int) -> Cell:
+        ''' stitches the start-rooted and goal-rooted halves of a bidirectional
+            search together where they meet
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start
+        '''
+        stats = context._stats
+        if stats is None:
+            return self._chain(context.pathTo(meet) + goal_context.pathTo(meet)[::-1][1:])
+        with stats.phase("path"):
+            return self._chain(context.pathTo(meet) + goal_context.pathTo(meet)[::-1][1:])
+
+    def _manhattan(self, index: int) -> int:
+        ''' returns the Manhattan distance from the cell at index to the goal,
+            a lower bound on the number of moves still needed '''
+        row, col = self._grid.position(index)
+        goal = self._goal._position
+        return abs(row - goal.row) + abs(col - goal.col)
+
+    def a_star_search(self, context: SearchContext | None = None) -> Cell | None:
+        ''' searches from the start for the goal, always expanding the cell
+            with the lowest path-cost-so-far plus Manhattan distance to the
+            goal; since that distance never overestimates, the path found is
+            a shortest one
+        Parameters:
+            context: optional fresh SearchContext to record the search in; one
+                     is created if not given; its getExpanded() reports how
+                     many cells were expanded
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal = self._goal_index
+        moves, steps = self._moves, self._steps
+        h    = self._manhattan
+
+        cost = array('q', [_NO_COST]) * len(self._grid)   # best known moves from the start
+        cost[self._start_index] = 0
+        frontier = context.frontier(PriorityQueue())
+        # ties on f are broken towards the larger g (smaller h), which keeps
+        # the search running along one of many equally good paths
+        frontier.push(self._start_index, (h(self._start_index), h(self._start_index)))
+        context.visit(self._start_index)
+
+        while not frontier.is_empty():
+            index = frontier.pop()
+            context._expanded += 1
+
+            if index == goal:
+                return self._pathTo(context, index)
+
+            new_cost = cost[index] + 1
+            for step in steps[moves[index]]:
+                candidate = index + step
+                if new_cost < cost[candidate]:
+                    cost[candidate] = new_cost
+                    context.visit(candidate, index)
+                    frontier.push(candidate, (new_cost + h(candidate), h(candidate)))
+
+        return None
+
+    def greedy_search(self, context: SearchContext | None = None) -> Cell | None:
+        ''' searches from the start for the goal, always expanding the seen
+            cell that is closest to the goal by Manhattan distance; usually
+            expands far fewer cells than A*, but the path found need not be a
+            shortest one
+        Parameters:
+            context: optional fresh SearchContext to record the search in; one
+                     is created if not given; its getExpanded() reports how
+                     many cells were expanded
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal = self._goal_index
+        moves, steps, seen = self._moves, self._steps, context._seen
+        h    = self._manhattan
+
+        frontier = context.frontier(PriorityQueue())
+        frontier.push(self._start_index, h(self._start_index))
+        context.visit(self._start_index)
+
+        while not frontier.is_empty():
+            index = frontier.pop()
+            context._expanded += 1
+
+            if index == goal:
+                return self._pathTo(context, index)
+
+            for step in steps[moves[index]]:
+                candidate = index + step
+                if seen[candidate]: continue
+                context.visit(candidate, index)
+                frontier.push(candidate, h(candidate))
+
+        return None
+
+    def _jumpVertical(self, index: int, step: int, bit: int) -> int:
+        ''' moves straight up or down from index until reaching the goal or
+            a cell with a forced neighbour: an open cell to the left or right
+            whose own neighbour behind it is blocked, so no path that turned
+            sideways earlier could have reached it as cheaply
+        Parameters:
+            index: flat index to move from
+            step:  -num_cols to move up, num_cols to move down
+            bit:   UP or DOWN, matching step
+        Returns:
+            flat index of the jump point, or -1 if a wall is hit first
+        '''
+        moves, goal = self._moves, self._goal_index
+        while moves[index] & bit:
+            index += step
+            if index == goal or moves[index] & ~moves[index - step] & (RIGHT | LEFT):
+                return index
+        return -1
+
+    def _jumpHorizontal(self, index: int, step: int, bit: int) -> int:
+        ''' moves straight left or right from index, scanning up and down from
+            every cell passed, until reaching the goal or a cell from which a
+            vertical scan finds a jump point
+        Parameters:
+            index: flat index to move from
+            step:  1 to move right, -1 to move left
+            bit:   RIGHT or LEFT, matching step
+        Returns:
+            flat index of the jump point, or -1 if a wall is hit first
+        '''
+        moves, goal, cols = self._moves, self._goal_index, self._num_cols
+        jump = self._jumpVertical
+        while moves[index] & bit:
+            index += step
+            if index == goal or jump(index, -cols, UP) != -1 or jump(index, cols, DOWN) != -1:
+                return index
+        return -1
+
+    def _fillJumps(self, jumps: list[int]) -> list[int]:
+        ''' fills in the straight runs between consecutive jump points, which
+            always share a row or a column
+        Returns:
+            list of the flat indices of every cell on the path
+        '''
+        cols = self._num_cols
+        path = jumps[:1]
+        for a, b in zip(jumps, jumps[1:]):
+            step = (1 if b > a else -1) if abs(b - a) < cols else (cols if b > a else -cols)
+            path.extend(range(a + step, b + step, step))
+        return path
+
+    def _jumpPath(self, context: SearchContext, index: int) -> Cell:
+        ''' builds fresh Cell objects for every cell on the path through the
+            jump points recorded in the search context
+        Returns:
+            the Cell at index, with its _parent chain leading back to the start
+        '''
+        stats = context._stats
+        if stats is None:
+            return self._chain(self._fillJumps(context.pathTo(index)))
+        with stats.phase("path"):
+            return self._chain(self._fillJumps(context.pathTo(index)))
+
+    def jump_point_search(self, context: SearchContext | None = None) -> Cell | None:
+        ''' A* over jump points (Jump Point Search for 4-connected grids):
+            of all the equally short paths between two cells, only the one
+            that moves horizontally as early as possible is followed, and
+            straight runs are scanned without touching the frontier, so only
+            the cells where a path may have to turn (and the goal) are ever
+            pushed; on open maps that is a small fraction of the cells A*
+            pushes. Move costs from withCosts are ignored: every move costs 1
+        Parameters:
+            context: optional fresh SearchContext to record the search in;
+                     only jump points are marked seen, and getExpanded()
+                     counts jump points expanded
+        Returns:
+            the goal Cell, with its _parent chain (one Cell per move, so
+            showPath can draw it) leading back to the start, or None if the
+            goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal, cols, moves = self._goal_index, self._num_cols, self._moves
+        h = self._manhattan
+        jump_v, jump_h = self._jumpVertical, self._jumpHorizontal
+
+        # step each jump point was arrived at along; 0 for the start
+        cost:    dict[int, int] = {self._start_index: 0}
+        arrived: dict[int, int] = {self._start_index: 0}
+        frontier = context.frontier(PriorityQueue())
+        frontier.push(self._start_index, (h(self._start_index), h(self._start_index)))
+        context.visit(self._start_index)
+
+        while not frontier.is_empty():
+            index = frontier.pop()
+            context._expanded += 1
+
+            if index == goal:
+                return self._jumpPath(context, index)
+
+            step = arrived[index]
+            if step == 0:             # the start: every direction
+                jumps = [jump_h(index, 1, RIGHT), jump_h(index, -1, LEFT), \
+                         jump_v(index, -cols, UP), jump_v(index, cols, DOWN)]
+            elif step in (1, -1):     # horizontal: onwards, and up and down
+                jumps = [jump_h(index, step, RIGHT if step == 1 else LEFT), \
+                         jump_v(index, -cols, UP), jump_v(index, cols, DOWN)]
+            else:                     # vertical: onwards, and forced turns only
+                jumps  = [jump_v(index, step, UP if step < 0 else DOWN)]
+                forced = moves[index] & ~moves[index - step]
+                if forced & RIGHT: jumps.append(jump_h(index, 1, RIGHT))
+                if forced & LEFT:  jumps.append(jump_h(index, -1, LEFT))
+
+            for candidate in jumps:
+                if candidate == -1: continue
+                # runs along a row differ by less than a row's width
+                step = candidate - index
+                if abs(step) < cols:
+                    distance, step = abs(step), (1 if step > 0 else -1)
+                else:
+                    distance, step = abs(step) // cols, (cols if step > 0 else -cols)
+
+                new_cost = cost[index] + distance
+                if new_cost < cost.get(candidate, new_cost + 1):
+                    cost[candidate] = new_cost
+                    arrived[candidate] = step
+                    context.visit(candidate, index)
+                    frontier.push(candidate, (new_cost + h(candidate), h(candidate)))
+
+        return None
+
+    def _terrain(self) -> bytes:
+        ''' returns the per-cell move costs, all 1 if none have been set '''
+        return self._costs if self._costs is not None else b"\x01" * len(self._grid)
+
+    def dijkstra_search(self, context: SearchContext | None = None) -> Cell | None:
+        ''' searches from the start for the goal, always expanding the cell
+            with the lowest total cost so far, on a heap (PriorityQueue) with
+            decrease-key; the path found is a cheapest one under the costs
+            given to withCosts (a shortest one if there are none)
+        Parameters:
+            context: optional fresh SearchContext to record the search in; one
+                     is created if not given
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal = self._goal_index
+        moves, steps, costs = self._moves, self._steps, self._terrain()
+
+        cost = array('q', [_NO_COST]) * len(self._grid)   # cheapest known cost from the start
+        cost[self._start_index] = 0
+        frontier = context.frontier(PriorityQueue())
+        frontier.push(self._start_index, 0)
+        context.visit(self._start_index)
+
+        while not frontier.is_empty():
+            index = frontier.pop()
+            context._expanded += 1
+
+            if index == goal:
+                return self._pathTo(context, index)
+
+            base = cost[index]
+            for step in steps[moves[index]]:
+                candidate = index + step
+                new_cost  = base + costs[candidate]
+                if new_cost < cost[candidate]:
+                    cost[candidate] = new_cost
+                    context.visit(candidate, index)
+                    frontier.push(candidate, new_cost)
+
+        return None
+
+    def dial_search(self, context: SearchContext | None = None) -> Cell | None:
+        ''' dijkstra_search on a bucket queue (Dial's algorithm): since every
+            cost is a small integer, the frontier is a ring of one list per
+            cost, making each push and pop O(1) instead of O(log n); a cell
+            may be queued more than once, and only its first, cheapest, pop
+            is expanded
+        Parameters:
+            context: optional fresh SearchContext to record the search in; one
+                     is created if not given
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        if context is None: context = self.newContext()
+        goal = self._goal_index
+        moves, steps, costs = self._moves, self._steps, self._terrain()
+
+        cost = array('q', [_NO_COST]) * len(self._grid)   # cheapest known cost from the start
+        cost[self._start_index] = 0
+        settled  = bytearray(len(self._grid))           # 1 once a cell has been expanded
+        frontier = context.frontier(BucketQueue(max(costs)))
+        frontier.push(self._start_index, 0)
+        context.visit(self._start_index)
+
+        while not frontier.is_empty():
+            index = frontier.pop()
+            if settled[index]: continue   # a stale, costlier copy
+            settled[index] = 1
+            context._expanded += 1
+
+            if index == goal:
+                return self._pathTo(context, index)
+
+            base = cost[index]
+            for step in steps[moves[index]]:
+                candidate = index + step
+                new_cost  = base + costs[candidate]
+                if new_cost < cost[candidate]:
+                    cost[candidate] = new_cost
+                    context.visit(candidate, index)
+                    frontier.push(candidate, new_cost)
+
+        return None
+
+    def _multiSourceSearch(self, sources: tuple[int, ...], context: SearchContext) -> array:
+        ''' breadth-first search seeded with every source at once, so in one
+            pass over the grid each open cell is reached from a source
+            nearest to it (ties go to whichever source's wave got there first)
+        Parameters:
+            sources: flat indices to search outward from
+            context: fresh SearchContext; afterwards each reached cell's
+                     parent chain leads back to its nearest source
+        Returns:
+            array holding, for every cell, the position in sources of its
+            nearest source, or -1 if no source reaches it
+        '''
+        moves, steps, seen = self._moves, self._steps, context._seen
+        labels = array('q', [-1]) * len(self._grid)
+
+        seeds = []
+        for label, index in enumerate(sources):
+            if seen[index]: continue   # the same cell listed twice
+            labels[index] = label
+            context.visit(index)
+            seeds.append(index)
+        queue = context.frontier(Queue(ring=True))
+        queue.push_many(seeds)
+
+        while not queue.isempty():
+            index = queue.pop()
+            context._expanded += 1
+
+            label = labels[index]
+            for step in steps[moves[index]]:
+                candidate = index + step
+                if seen[candidate]: continue
+                labels[candidate] = label
+                queue.push(candidate)
+                context.visit(candidate, index)
+
+        return labels
+
+    def nearest_goals(self, context: SearchContext | None = None) -> dict[Position, Cell | None]:
+        ''' finds, for every start, a shortest path to its nearest goal, with
+            one breadth-first search seeded with all the goals at once rather
+            than one search per start and goal
+        Parameters:
+            context: optional fresh SearchContext to record the search in
+        Returns:
+            dict mapping each start's Position to the goal Cell it is nearest
+            to, with its _parent chain leading back to that start, or to None
+            if no goal can be reached from it
+        '''
+        if context is None: context = self.newContext()
+        labels = self._multiSourceSearch(self._goals, context)
+
+        nearest: dict[Position, Cell | None] = {}
+        for index in self._starts:
+            position = Position(*self._grid.position(index))
+            # parent links point towards the goals, so walk them from the start
+            nearest[position] = None if labels[index] == -1 else \
+                                self._chain(context.pathTo(index)[::-1])
+        return nearest
+
+    def nearest_starts(self, context: SearchContext | None = None) -> array:
+        ''' labels every cell with the start nearest to it, with one
+            breadth-first search seeded with all the starts at once
+        Parameters:
+            context: optional fresh SearchContext to record the search in;
+                     each reached cell's parent chain leads back to its start
+        Returns:
+            array holding, for every flat grid index, the position in
+            getStarts() of the nearest start, or -1 if no start reaches it
+        '''
+        if context is None: context = self.newContext()
+        return self._multiSourceSearch(self._starts, context)
+
+    def _labels(self) -> array:
+        ''' labels every open cell with the id of its connected component,
+            flood filling each component once; the labels are built on first
+            use and kept, since the grid never changes (if two threads race
+            here, both build the same labels); a view's labels are its base
+            Maze's, since the two share a grid
+        Returns:
+            array of one component id per cell, -1 for blocked cells
+        '''
+        if self._base is not None:
+            return self._base._labels()
+        if self._components is not None:
+            return self._components
+
+        moves, steps = self._moves, self._steps
+        blocked = _CODE[Contents.BLOCKED]
+        labels  = array('q', [-1]) * len(self._grid)
+
+        label = 0
+        for index, code in enumerate(self._grid._contents):
+            if code == blocked or labels[index] != -1:
+                continue
+            # the fill order doesn't matter, so a plain list is used as the stack
+            labels[index] = label
+            stack = [index]
+            while stack:
+                cell = stack.pop()
+                for step in steps[moves[cell]]:
+                    candidate = cell + step
+                    if labels[candidate] == -1:
+                        labels[candidate] = label
+                        stack.append(candidate)
+            label += 1
+
+        self._components = labels
+        return labels
+
+    def is_reachable(self, a: Position, b: Position) -> bool:
+        ''' indicates whether any path joins two cells, in constant time once
+            the component labels have been built
+        Parameters:
+            a: Position of one cell
+            b: Position of the other cell
+        Returns:
+            True if both cells are open and in the same connected component
+        Raises:
+            ValueError if either Position is outside the grid
+        '''
+        if not self._grid.inBounds(a.row, a.col) or not self._grid.inBounds(b.row, b.col):
+            raise ValueError("both positions must be inside the grid")
+        labels = self._labels()
+        label  = labels[self._grid.index(a.row, a.col)]
+        return label != -1 and label == labels[self._grid.index(b.row, b.col)]
+
+    def _boundedSearch(self, bound: int, h, table_size: int, context: SearchContext | None) \
+                       -> tuple[list[int] | None, int | None, int | None]:
+        ''' one depth-first pass of an iterative-deepening search, following
+            only paths whose moves-so-far plus h(cell) stay within bound; it
+            keeps just the current path (and at most table_size transposition
+            entries), so memory grows with the bound, not the maze
+        Parameters:
+            bound:      largest f = g + h(cell) a followed cell may have
+            h:          heuristic, a function of a flat index
+            table_size: maximum number of cells whose best depth is remembered
+                        for pruning in this pass (0 disables the table)
+            context:    optional SearchContext whose expansion count is updated
+        Returns:
+            the path of flat indices from start to goal if found, the
+            smallest f that exceeded bound (None if nothing was cut off), and
+            the number of distinct cells the pass reached besides the start
+            (None if the table is disabled or full, so it is not known)
+        '''
+        moves, steps = self._moves, self._steps
+        goal = self._goal_index
+
+        path     = [self._start_index]   # cells on the current path
+        cursor   = [0]                   # next step to try from each path cell
+        on_path  = {self._start_index}
+        table: dict[int, int] = {}       # cell -> smallest depth it was reached at
+        next_bound = None
+        expanded   = 1
+
+        while path:
+            index = path[-1]
+            if index == goal:
+                break
+
+            options = steps[moves[index]]
+            i = cursor[-1]
+            if i == len(options):
+                on_path.discard(path.pop())
+                cursor.pop()
+                continue
+            cursor[-1] = i + 1
+
+            candidate = index + options[i]
+            if candidate in on_path:
+                continue
+
+            g = len(path)
+            f = g + h(candidate)
+            if f > bound:
+                if next_bound is None or f < next_bound: next_bound = f
+                continue
+
+            if table_size:
+                best = table.get(candidate)
+                if best is not None and best <= g:
+                    continue
+                if best is not None or len(table) < table_size:
+                    table[candidate] = g
+
+            path.append(candidate)
+            cursor.append(0)
+            on_path.add(candidate)
+            expanded += 1
+
+        if context is not None: context._expanded += expanded
+        reached = len(table) if len(table) < table_size else None
+        return (path if path else None), next_bound, reached
+
+    def _deepen(self, h, table_size: int, context: SearchContext | None) -> Cell | None:
+        ''' reruns _boundedSearch with a growing bound until the goal is found
+            or the goal's absence is certain: no path was cut off by the
+            bound, or a pass reached no cell the pass before it did not (so
+            the start's component has been exhausted; with a consistent
+            heuristic a higher bound cannot reach further). Without that, an
+            unreachable goal would have every pass walk every simple path
+            under an ever-growing bound. Growth can only be seen while the
+            transposition table holds every reached cell; with the table
+            disabled or full, the component labels answer instead (built,
+            once, only then) '''
+        start, goal = self._start._position, self._goal._position
+        if (self._base or self)._components is not None and not self.is_reachable(start, goal):
+            return None
+
+        bound    = h(self._start_index)
+        previous = -1   # cells reached by the last pass
+        while True:
+            path, next_bound, reached = self._boundedSearch(bound, h, table_size, context)
+            if path is not None:
+                return self._chain(path)
+            if next_bound is None or reached == previous:
+                return None
+            if reached is None and not self.is_reachable(start, goal):
+                return None
+            previous = reached
+            bound    = next_bound
+
+    def iterative_deepening_search(self, context: SearchContext | None = None, \
+                                         table_size: int = DEEPENING_TABLE_SIZE) -> Cell | None:
+        ''' depth-first search rerun with a depth limit of 0, 1, 2, ... moves
+            until the goal is reached, so the path found is a shortest one;
+            cells are re-expanded on every pass, trading CPU for memory that
+            only grows with the current depth limit
+        Parameters:
+            context:    optional SearchContext; only its expansion count is
+                        used, its arrays are left untouched
+            table_size: cap on the transposition table used to skip cells
+                        already reached by a shorter path in the same pass
+                        (default DEEPENING_TABLE_SIZE; 0 disables it)
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        return self._deepen(lambda index: 0, table_size, context)
+
+    def ida_star_search(self, context: SearchContext | None = None, \
+                              table_size: int = DEEPENING_TABLE_SIZE) -> Cell | None:
+        ''' iterative-deepening A*: like iterative_deepening_search, but each
+            pass is bounded by moves-so-far plus Manhattan distance to the
+            goal, starting from the start's distance and growing to the
+            smallest value cut off by the last pass; the path found is a
+            shortest one
+        Parameters:
+            context:    optional SearchContext; only its expansion count is
+                        used, its arrays are left untouched
+            table_size: cap on the transposition table (default
+                        DEEPENING_TABLE_SIZE; 0 disables it)
+        Returns:
+            the goal Cell, with its _parent chain leading back to the start,
+            or None if the goal cannot be reached
+        '''
+        return self._deepen(self._manhattan, table_size, context)
 
+    def profile(self, algorithm: str = "breadth_first_search", \
+                      callback: Callable[[int, int], None] | None = None, \
+                      **options) -> tuple[Cell | None, SearchStats]:
+        ''' runs one search with instrumentation switched on
+        Parameters:
+            algorithm: name of the search method to run, e.g. "a_star_search"
+            callback:  optional hook called as callback(index, frontier_size)
+                       for every flat index popped off the search's frontier
+            options:   any further keyword arguments for the search method
+        Returns:
+            the search's result (the goal Cell, or None), and a SearchStats
+            with its expansions, frontier pushes, pops and peak size, and
+            its "search" time, of which "path" was spent building the path
+        '''
+        stats  = SearchStats(callback)
+        search = getattr(self, algorithm)
+        with stats.phase("search"):
+            goal = search(self.newContext(stats), **options)
+        return goal, stats
+
+    def setFieldCacheLimit(self, nbytes: int) -> None:
+        ''' sets the memory bound on cached DistanceFields, evicting the least
+            recently used fields until they fit '''
+        with self._fields_lock:
+            self._fields_limit = nbytes
+            self._evictFields()
+
+    def _evictFields(self) -> None:
+        ''' drops least recently used fields while the cache is over its bound;
+            the caller must hold _fields_lock '''
+        total = sum(field.nbytes() for field in self._fields.values())
+        while self._fields and total > self._fields_limit:
+            _, field = self._fields.popitem(last=False)
+            total -= field.nbytes()
+
+    def distanceField(self, source: Position | None = None) -> DistanceField:
+        ''' returns the distances and next hops from every open cell to source,
+            building them with one breadth-first search the first time and
+            serving them from the LRU cache afterwards
+        Parameters:
+            source: Position every distance is measured to (default the goal)
+        Returns:
+            the DistanceField for source
+        Raises:
+            ValueError if source is outside the grid or blocked
+        '''
+        if source is None: source = self._goal._position
+        if not self._grid.inBounds(source.row, source.col):
+            raise ValueError("source must be inside the grid")
+        index = self._grid.index(source.row, source.col)
+        if self._grid.get(index) == _CODE[Contents.BLOCKED]:
+            raise ValueError("source must not be a blocked cell")
+
+        with self._fields_lock:
+            field = self._fields.get(source)
+            if field is not None:
+                self._fields.move_to_end(source)
+                return field
+
+        # build outside the lock so other threads can keep reading the cache
+        field = DistanceField(self, index)
+        with self._fields_lock:
+            self._fields[source] = field
+            self._fields.move_to_end(source)
+            self._evictFields()
+        return field
+
+    def path_from(self, start: Position, source: Position | None = None) -> Cell | None:
+        ''' finds a shortest path from start to source by walking down the
+            source's DistanceField, with no search once the field is cached
+        Parameters:
+            start:  Position the path begins at
+            source: Position the path ends at (default the goal)
+        Returns:
+            the Cell at source, with its _parent chain leading back to start,
+            or None if source cannot be reached from start
+        Raises:
+            ValueError if start is outside the grid
+        '''
+        if not self._grid.inBounds(start.row, start.col):
+            raise ValueError("start must be inside the grid")
+        path = self.distanceField(source).pathFrom(self._grid.index(start.row, start.col))
+        return None if path is None else self._chain(path)
 
+###########################################################
+def test_searches():
+    ''' checks every shortest-path search against breadth_first_search on
+        seeded mazes, and that they all give up on an unreachable goal '''
+    searches = ["bidirectional_search", "a_star_search", "jump_point_search", \
+                "ida_star_search", "dijkstra_search", "dial_search"]
+
+    for seed in range(60):
+        rng  = random.Random(seed)
+        rows, cols = rng.randint(1, 14), rng.randint(1, 14)
+        start = Position(rng.randrange(rows), rng.randrange(cols))
+        goal  = Position(rng.randrange(rows), rng.randrange(cols))
+        if start == goal:
+            continue
+        m = Maze.generate(rows, cols, start, goal, rng.choice([0.0, 0.2, 0.35]), seed, method="random")
+
+        expected = m.breadth_first_search()
+        for name in searches:
+            found = getattr(m, name)()
+            if expected is None:
+                assert found is None, f"{name} found a path BFS did not (seed {seed})"
+                continue
+            assert found is not None, f"{name} missed a path (seed {seed})"
+            path = m._pathIndices(found)
+            assert len(path) == len(m._pathIndices(expected)), \
+                   f"{name} path is not a shortest one (seed {seed})"
+            for a, b in zip(path, path[1:]):
+                (ra, ca), (rb, cb) = m._grid.position(a), m._grid.position(b)
+                assert abs(ra - rb) + abs(ca - cb) == 1, f"{name} path jumps a cell (seed {seed})"
+                assert m._grid.get(a) != _CODE[Contents.BLOCKED], f"{name} path is blocked (seed {seed})"
+
+    # the goal is walled off, so every search must return None (and the
+    # iterative-deepening ones must not keep deepening forever)
+    m = Maze.from_text(["S" + "." * 7 + "X."] + ["." * 8 + "X."] * 6 + ["." * 8 + "XG"])
+    assert not m.is_reachable(m.getStart().getPosition(), m.getGoal().getPosition())
+    for name in ["depth_first_search", "breadth_first_search", "iterative_deepening_search", *searches]:
+        assert getattr(m, name)() is None, f"{name} found a path to an unreachable goal"
+    for name in ["iterative_deepening_search", "ida_star_search"]:
+        assert getattr(m, name)(table_size=0) is None, f"{name} found a path to an unreachable goal"
 
-        pass
 
 ###########################################################
 def main() -> None:
 
-    #m = Maze(debug = True)
-    
-    m = Maze()
-    #print(m)
-
-    m._grid[0][4]._parent = m._grid[0][3]
-    m._grid[0][3]._parent = m._grid[0][2]
-    m._grid[0][2]._parent = m._grid[0][1]
-    m._grid[0][1]._parent = m._grid[0][0]
-
-    #print(m.getSearchLocations(m._grid[0][1]))
-    m._grid[0][0]._parent = m._grid[1][0]
-    m._grid[1][0]._parent = m._grid[2][0]
-    m._grid[2][0]._parent = m._grid[3][0]
-    m._grid[3][0]._parent = m._grid[4][0]
-    m._grid[4][0]._parent = m._grid[5][0]
-
+    test_searches()
 
+    m = Maze(debug = True)
+    print(m)
     print()
-    #m.showPath(m._goal)
-
-    print()
-
-
-
-    goal = m.depth_first_search()
-
-    m.showPath(goal)
 
+    for search in [m.depth_first_search, m.breadth_first_search, m.bidirectional_search, \
+                   m.a_star_search, m.greedy_search, m.jump_point_search]:
+        context = m.newContext()
+        if search == m.bidirectional_search:
+            # count the half of the search rooted at the goal as well
+            goal_context = m.newContext()
+            goal = search(context, goal_context)
+            expanded = context.getExpanded() + goal_context.getExpanded()
+        else:
+            goal = search(context)
+            expanded = context.getExpanded()
 
+        print(f"{search.__name__}: expanded {expanded} cells")
+        if goal is None:
+            print("no path from start to goal")
+        else:
+            m.showPath(goal)
+        print()
 
+    goal, stats = m.profile("a_star_search")
+    m.showPath(goal, stats=stats)
+    print(f"a_star_search profile: {stats}")
+    print()
 
-
-    '''
-    start = Cell(0,0, Contents.START)
-    goal  = Cell(9,9, Contents.GOAL)
-    empty = Cell(4,4, Contents.EMPTY)
-    block = Cell(2,2, Contents.BLOCKED)
-    path  = Cell(9,8, Contents.PATH)
-
-    for c in [start,goal,empty,block,path]:
-        print(c)
-    print('-' * 40)
-
-    print(f"before: {empty}")
-    empty.markOnPath()
-    print(f"after:  {empty}")
-
-
-    print('-' * 40)
-
-    for c in Contents:
-        print(c)
-    print('-' * 40)
-
-    p1 = Position(3,4)
-    p2 = Position(9,8)
-    p3 = (7,7)
-
-    print(f"row for p1 is: {p1.row}")
-    print(f"col for p1 is: {p1.col}")
-    print(f"row for p3 is: {p3[0]}")
-    print(f"col for p3 is: {p3[1]}")
-    print(f"p2 is: {p2}")
-    '''
-
-    print(m.depth_first_search())
+    # two starts, two goals: one search finds each start's nearest goal
+    v = m.withEndpointSets([Position(5, 0), Position(0, 0)], [Position(0, 4), Position(3, 4)])
+    for start, goal in v.nearest_goals().items():
+        print(f"nearest goal to {start}: {goal}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,303 @@
+''' functions that generate the blocked cells of mazes, producing a
+    flat mask (one byte per cell, nonzero where blocked) indexed by
+    row * num_cols + col, which Maze hands straight to its Grid '''
+from __future__ import annotations
+import random
+from array import array
+
+from Stack import Stack
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized generator needs it
+    np = None
+
+# number of cells drawn per vectorized call, to bound temporary memory
+_CHUNK = 1 << 24
+
+
+def numpy_blocked(num_rows: int, num_cols: int, proportion_blocked: float, \
+                  seed: int | None = None) -> bytearray:
+    ''' draws a blocked mask with a seeded numpy.random.Generator, blocking
+        each cell independently with probability proportion_blocked
+    Parameters:
+        num_rows:           number of rows in the grid
+        num_cols:           number of columns in the grid
+        proportion_blocked: probability that a cell is blocked
+        seed:               seed for numpy.random.default_rng
+    Returns:
+        bytearray mask of num_rows * num_cols bytes, 1 where blocked
+    Raises:
+        ImportError if NumPy is not installed
+    '''
+    if np is None:
+        raise ImportError("numpy_blocked requires NumPy; install it with 'pip install numpy'")
+
+    rng  = np.random.default_rng(seed)
+    size = num_rows * num_cols
+    mask = np.empty(size, dtype=np.uint8)
+
+    # compare 16-bit random integers against a threshold rather than drawing
+    # floats, which keeps the temporaries per chunk to a few bytes per cell
+    threshold = round(proportion_blocked * (1 << 16))
+    for lo in range(0, size, _CHUNK):
+        hi = min(size, lo + _CHUNK)
+        mask[lo:hi] = rng.integers(0, 1 << 16, hi - lo, dtype=np.uint16) < threshold
+
+    return bytearray(mask)
+
+
+def terrain_costs(num_rows: int, num_cols: int, max_cost: int = 9, \
+                  seed: int | None = None) -> bytearray:
+    ''' draws a random traversal cost for every cell, for Maze.withCosts
+    Parameters:
+        num_rows: number of rows in the grid
+        num_cols: number of columns in the grid
+        max_cost: largest cost drawn; costs run from 1 to max_cost, very
+                  nearly uniformly
+        seed:     seed for the random draws, for repeatable terrain
+    Returns:
+        bytearray of num_rows * num_cols costs
+    Raises:
+        ValueError if max_cost is not between 1 and 255
+    '''
+    if not 1 <= max_cost <= 255:
+        raise ValueError("max_cost must be between 1 and 255")
+    # map random bytes onto 1..max_cost with a translation table, so no
+    # per-cell Python work is done
+    table = bytes(1 + b % max_cost for b in range(256))
+    return bytearray(random.Random(seed).randbytes(num_rows * num_cols).translate(table))
+
+
+######################################################################
+# seeded, pure-Python generators; every one takes an explicit seed so the
+# same arguments always give the same maze
+
+def carve_path(num_rows: int, num_cols: int, start: tuple[int, int], goal: tuple[int, int], \
+               rng: random.Random) -> list[int]:
+    ''' picks a random monotone path from start to goal, stepping one row or
+        one column towards the goal each time
+    Returns:
+        list of the flat indices on the path, start and goal included
+    '''
+    row, col = start
+    path = [row * num_cols + col]
+    while (row, col) != tuple(goal):
+        # move along rows or columns, weighted by how far each still has to go
+        rows_left = goal[0] - row
+        cols_left = goal[1] - col
+        if rng.randrange(abs(rows_left) + abs(cols_left)) < abs(rows_left):
+            row += 1 if rows_left > 0 else -1
+        else:
+            col += 1 if cols_left > 0 else -1
+        path.append(row * num_cols + col)
+    return path
+
+
+def random_blocked(num_rows: int, num_cols: int, start: tuple[int, int], goal: tuple[int, int], \
+                   proportion_blocked: float, seed: int | None = None, \
+                   solvable: bool = False) -> bytearray:
+    ''' blocks int((num_rows * num_cols - 2) * proportion_blocked) cells,
+        chosen at random, never blocking the start or goal
+    Parameters:
+        num_rows:           number of rows in the grid
+        num_cols:           number of columns in the grid
+        start:              (row, col) of the start cell
+        goal:               (row, col) of the goal cell
+        proportion_blocked: proportion of cells to be blocked
+        seed:               seed for the random.Random used
+        solvable:           if True, a random path from start to goal is
+                            carved first and kept open, so the maze always
+                            has a solution (fewer cells may then be blocked)
+    Returns:
+        bytearray mask of num_rows * num_cols bytes, 1 where blocked
+    '''
+    rng  = random.Random(seed)
+    size = num_rows * num_cols
+
+    if solvable:
+        keep = set(carve_path(num_rows, num_cols, start, goal, rng))
+    else:
+        keep = {start[0] * num_cols + start[1], goal[0] * num_cols + goal[1]}
+
+    how_many = min(int((size - 2) * proportion_blocked), size - len(keep))
+
+    # sample len(keep) extra indices so the kept cells can be dropped without
+    # building a list of every candidate cell
+    picked = rng.sample(range(size), k = min(size, how_many + len(keep)))
+    mask = bytearray(size)
+    for index in [i for i in picked if i not in keep][:how_many]:
+        mask[index] = 1
+    return mask
+
+
+def _rooms(num_rows: int, num_cols: int) -> tuple[bytearray, list[int]]:
+    ''' sets up a fully blocked mask for the perfect-maze generators, which
+        treat the cells at even (row, col) as rooms and the cells between
+        them as walls that can be knocked down
+    Returns:
+        the mask, and the flat indices of every room
+    '''
+    mask  = bytearray([1]) * (num_rows * num_cols)
+    rooms = [r * num_cols + c for r in range(0, num_rows, 2) for c in range(0, num_cols, 2)]
+    return mask, rooms
+
+
+def _walls(index: int, num_rows: int, num_cols: int) -> list[tuple[int, int]]:
+    ''' Returns:
+        (wall, room) pairs for every room two cells away from the room at
+        index, in up, down, right, left order, with the wall cell between them
+    '''
+    row, col = divmod(index, num_cols)
+    res = []
+    if row >= 2:            res.append((index - num_cols, index - 2 * num_cols))
+    if row + 2 < num_rows:  res.append((index + num_cols, index + 2 * num_cols))
+    if col + 2 < num_cols:  res.append((index + 1, index + 2))
+    if col >= 2:            res.append((index - 1, index - 2))
+    return res
+
+
+def _connect(mask: bytearray, num_rows: int, num_cols: int, cell: tuple[int, int]) -> None:
+    ''' opens a start or goal cell that is not on a room so it joins the
+        maze, adding no loop where that can be avoided: a wall cell borders
+        its rooms directly, and a pillar (odd row and column) joins through
+        a neighbouring wall that is already open, or else opens the wall
+        bordering the fewest rooms. Opening a wall between two rooms, or a
+        pillar next to two open walls, does add a loop, since those rooms
+        are already connected; so off-lattice endpoints can make the maze
+        slightly less than perfect '''
+    row, col = cell
+    index = row * num_cols + col
+    if not mask[index]:
+        return   # a room, or a wall the generator already knocked down
+    mask[index] = 0
+    if row % 2 == 0 or col % 2 == 0:
+        return   # a wall cell, next to at least one room
+
+    def rooms(wall: int) -> int:
+        r, c = divmod(wall, num_cols)
+        return sum(0 <= r + dr < num_rows and 0 <= c + dc < num_cols
+                   for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)) if (r + dr) % 2 == 0 and (c + dc) % 2 == 0)
+
+    walls = [index - num_cols, index - 1]   # a pillar always has rooms above-left
+    if row + 1 < num_rows: walls.append(index + num_cols)
+    if col + 1 < num_cols: walls.append(index + 1)
+    if any(not mask[wall] for wall in walls):
+        return
+    mask[min(walls, key=rooms)] = 0
+
+
+def backtracker(num_rows: int, num_cols: int, start: tuple[int, int], goal: tuple[int, int], \
+                seed: int | None = None) -> bytearray:
+    ''' generates a perfect maze (exactly one route between any two rooms)
+        with the recursive backtracker algorithm, run on an explicit Stack
+        rather than by recursion; it gives long, winding corridors
+    Returns:
+        bytearray mask of num_rows * num_cols bytes, 1 where blocked
+    '''
+    rng = random.Random(seed)
+    mask, rooms = _rooms(num_rows, num_cols)
+
+    first = rng.choice(rooms)
+    mask[first] = 0
+    stack = Stack[int](strict=False)
+    stack.push(first)
+
+    while not stack.is_empty():
+        options = [(wall, room) for wall, room in _walls(stack.top(), num_rows, num_cols) if mask[room]]
+        if not options:
+            stack.pop()
+            continue
+        wall, room = rng.choice(options)
+        mask[wall] = mask[room] = 0
+        stack.push(room)
+
+    _connect(mask, num_rows, num_cols, start)
+    _connect(mask, num_rows, num_cols, goal)
+    return mask
+
+
+def prim(num_rows: int, num_cols: int, start: tuple[int, int], goal: tuple[int, int], \
+         seed: int | None = None) -> bytearray:
+    ''' generates a perfect maze with randomized Prim's algorithm, growing
+        the maze from one room by knocking down a random wall on its edge
+        each step; it gives many short dead ends
+    Returns:
+        bytearray mask of num_rows * num_cols bytes, 1 where blocked
+    '''
+    rng = random.Random(seed)
+    mask, rooms = _rooms(num_rows, num_cols)
+
+    first = rng.choice(rooms)
+    mask[first] = 0
+    frontier = _walls(first, num_rows, num_cols)
+
+    while frontier:
+        # swap a random entry to the end so it can be popped in O(1)
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        wall, room = frontier.pop()
+        if mask[room]:
+            mask[wall] = mask[room] = 0
+            frontier.extend(_walls(room, num_rows, num_cols))
+
+    _connect(mask, num_rows, num_cols, start)
+    _connect(mask, num_rows, num_cols, goal)
+    return mask
+
+
+class _DisjointSets:
+    ''' union-find over flat indices, with path halving and union by size '''
+    __slots__ = ('_parent', '_size')
+
+    def __init__(self, size: int) -> None:
+        self._parent: array = array('q', range(size))
+        self._size:   array = array('q', [1]) * size
+
+    def find(self, index: int) -> int:
+        parent = self._parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(self, a: int, b: int) -> bool:
+        ''' Returns:
+            True if a and b were in different sets (which are now merged)
+        '''
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self._size[a] < self._size[b]:
+            a, b = b, a
+        self._parent[b] = a
+        self._size[a] += self._size[b]
+        return True
+
+
+def kruskal(num_rows: int, num_cols: int, start: tuple[int, int], goal: tuple[int, int], \
+            seed: int | None = None) -> bytearray:
+    ''' generates a perfect maze with randomized Kruskal's algorithm: every
+        wall is visited in random order and knocked down whenever the rooms
+        on either side are not yet connected
+    Returns:
+        bytearray mask of num_rows * num_cols bytes, 1 where blocked
+    '''
+    rng = random.Random(seed)
+    mask, rooms = _rooms(num_rows, num_cols)
+    for room in rooms:
+        mask[room] = 0
+
+    # only the down and right walls of each room, so each wall appears once
+    walls = [(room, wall, other) for room in rooms \
+                                 for wall, other in _walls(room, num_rows, num_cols) if other > room]
+    rng.shuffle(walls)
+
+    sets = _DisjointSets(num_rows * num_cols)
+    for room, wall, other in walls:
+        if sets.union(room, other):
+            mask[wall] = 0
+
+    _connect(mask, num_rows, num_cols, start)
+    _connect(mask, num_rows, num_cols, goal)
+    return mask
@@ -0,0 +1,122 @@
+from __future__ import annotations
+import heapq
+from itertools import count
+from typing import Any, TypeVar
+
+from Stack import EmptyError
+
+T = TypeVar('T')
+
+# placeholder left in a heap entry whose item has been re-prioritized or removed
+_REMOVED = object()
+
+class PriorityQueue[T]:
+    ''' class to implement a min-priority queue ADT using a binary heap
+        (heapq) over a Python list; pushing an item that is already queued
+        changes its priority, with the stale heap entry deleted lazily '''
+
+    __slots__ = ("_heap", "_entries", "_counter")
+
+    def __init__(self):
+        self._heap:    list[list]      = []   # heap of [priority, order, item] entries
+        self._entries: dict[T, list]   = {}   # item -> its live heap entry
+        self._counter                  = count()  # breaks ties in push order
+
+    def __len__(self) -> int:
+        ''' Returns:
+            number of items in the priority queue, as an integer
+        '''
+        return len(self._entries)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._entries
+
+    def push(self, item: T, priority: Any) -> None:
+        ''' pushes a given hashable item with the given priority; if the item
+            is already queued, its priority is replaced (decrease- or
+            increase-key)
+        Parameters:
+            item:     a hashable item of arbitrary type
+            priority: any value comparable with the other priorities
+        Returns:
+            None
+        '''
+        if item in self._entries:
+            self._entries.pop(item)[-1] = _REMOVED
+        entry = [priority, next(self._counter), item]
+        self._entries[item] = entry
+        heapq.heappush(self._heap, entry)
+
+    def remove(self, item: T) -> None:
+        ''' removes a queued item without popping it
+        Raises:
+            KeyError if the item is not queued
+        '''
+        self._entries.pop(item)[-1] = _REMOVED
+
+    def _prune(self) -> None:
+        ''' discards stale entries from the top of the heap '''
+        heap = self._heap
+        while heap and heap[0][-1] is _REMOVED:
+            heapq.heappop(heap)
+
+    def pop(self) -> T:
+        ''' removes the item with the lowest priority and returns that item
+        Returns:
+            the lowest-priority item, of arbitrary type
+        Raises:
+            EmptyError exception if the priority queue is empty
+        '''
+        self._prune()
+        if len(self._heap) == 0:
+            raise EmptyError('Error in PriorityQueue.pop(): priority queue is empty')
+        item = heapq.heappop(self._heap)[-1]
+        del self._entries[item]
+        return item
+
+    def top(self) -> T:
+        ''' returns the item with the lowest priority without removing it
+        Raises:
+            EmptyError exception if the priority queue is empty
+        '''
+        self._prune()
+        if len(self._heap) == 0:
+            raise EmptyError('Error in PriorityQueue.top(): priority queue is empty')
+        return self._heap[0][-1]
+
+    def is_empty(self) -> bool:
+        ''' indicates whether the priority queue is empty
+        Returns:
+            True if the priority queue is empty, False otherwise
+        '''
+        return len(self._entries) == 0
+
+    def __str__(self) -> str:
+        ''' creates a string representation of the queued items, lowest
+            priority first, as item:priority pairs
+        '''
+        entries = sorted(entry for entry in self._heap if entry[-1] is not _REMOVED)
+        return "--- top ---\n" + "".join(f"{entry[-1]}:{entry[0]}\n" for entry in entries) + "--- bot ---"
+
+
+###################
+def main() -> None:
+    pq = PriorityQueue[str]()
+    for word, priority in [("eight", 8), ("six", 6), ("seven", 7), ("five", 5)]:
+        pq.push(word, priority)
+    print(pq)
+
+    pq.push("eight", 1)   # decrease-key
+    print(f"top after decrease-key: {pq.top()}")
+
+    while not pq.is_empty():
+        print(pq.pop())
+
+    try:
+        pq.pop()
+    except EmptyError as err:
+        print(f"Successfully caught pop from empty queue: {err.message}")
+
+
+if __name__ == "__main__":
+    main()
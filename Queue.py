@@ -1,16 +1,28 @@
-from typing import TypeVar
+from typing import Iterable, TypeVar
 
 T= TypeVar('T')
 
 
 from linkedList import *
+from RingBuffer import RingBuffer
 
 class Queue():
 
     __slots__ = ('_data')
 
-    def __init__ (self)-> None:
-        self._data = LinkedList()
+    def __init__ (self, ring: bool = False, capacity: int = 16, strict: bool = True, \
+                        pool: bool = False)-> None:
+        ''' Queue initializer method
+        Parameters:
+            ring:     if True, store items in a growable circular buffer
+                      (RingBuffer) rather than a LinkedList, so pushes and pops
+                      don't allocate or unlink a Node per item
+            capacity: initial number of slots for the circular buffer
+            strict:   for the LinkedList, whether to check that every pushed
+                      item has the same type (the RingBuffer never checks)
+            pool:     for the LinkedList, whether to reuse popped Nodes
+        '''
+        self._data = RingBuffer(capacity) if ring else LinkedList(strict=strict, pool=pool)
 
     def __len__(self)-> int:
         return len(self._data)
@@ -18,8 +30,19 @@ class Queue():
     def push(self, item: T)-> None:
         self._data.add_right(item)
 
+    def push_many(self, items: Iterable[T])-> None:
+        ''' pushes every item from items onto the back of the queue, in order '''
+        self._data.add_right_many(items)
+
     def pop(self)-> T:
        return self._data.remove_left()
+
+    def pop_many(self, n: int)-> list[T]:
+        ''' pops up to n items from the front of the queue
+        Returns:
+            list of the popped items, front first
+        '''
+        return self._data.remove_left_many(n)
     
     def top(self) -> T:
         return self._data.front()
@@ -35,15 +58,12 @@ class Queue():
             string representation of the stack
         '''
 
-        data_list = []
-        ptr = self._data._head
-
-        for i in range(self._data._size):
-            data_list.append(ptr.data)
-
-            ptr = ptr.next
+        data_list = list(self._data)
 
         result     = "--- top ---\n"
+        if len(data_list) == 0:
+            return result + "--- bot ---"
+
         max_len    = max(len(str(datum)) for datum in data_list)
     
         half_width = max(0, (len(result) - max_len) // 2)
@@ -74,6 +94,11 @@ def main():
 
     print(q.top())
 
+    r = Queue(ring=True, capacity=4)
+    r.push_many(range(10))
+    print(r.pop_many(3))
+    print(r)
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
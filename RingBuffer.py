@@ -0,0 +1,119 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+from linkedList import EmptyError
+
+######################################################################
+class RingBuffer[T]:
+    ''' class to implement a growable circular buffer over a Python list;
+        offers the same add_right / remove_left / front / back interface
+        as LinkedList, but without allocating a Node per item '''
+    __slots__ = ('_data', '_head', '_size')
+
+    def __init__(self, capacity: int = 16) -> None:
+        ''' RingBuffer initializer method
+        Parameters:
+            capacity: number of slots to allocate up front (grows as needed)
+        '''
+        self._data: list[T] = [None] * max(1, capacity)
+        self._head: int     = 0   # slot holding the leftmost item
+        self._size: int     = 0   # number of items in the buffer
+
+    def __len__(self) -> int:
+        ''' returns the number of items in the buffer '''
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        ''' walks the items from left to right without removing them '''
+        data = self._data
+        cap  = len(data)
+        for i in range(self._size):
+            yield data[(self._head + i) % cap]
+
+    def _grow(self, needed: int) -> None:
+        ''' re-lays the items out, starting at slot 0, in a list with room
+            for at least needed items '''
+        cap = len(self._data)
+        new_cap = cap
+        while new_cap < needed: new_cap *= 2
+
+        items = list(self)
+        self._data = items + [None] * (new_cap - len(items))
+        self._head = 0
+
+    def front(self) -> T:
+        ''' returns the leftmost item without removing it
+        Raises:
+            EmptyError if the buffer is empty
+        '''
+        if self._size == 0:
+            raise EmptyError('Buffer already empty')
+        return self._data[self._head]
+
+    def back(self) -> T:
+        ''' returns the rightmost item without removing it
+        Raises:
+            EmptyError if the buffer is empty
+        '''
+        if self._size == 0:
+            raise EmptyError('Buffer already empty')
+        return self._data[(self._head + self._size - 1) % len(self._data)]
+
+    def add_right(self, item: T) -> None:
+        ''' adds the given item to the right end of the buffer '''
+        data = self._data
+        if self._size == len(data):
+            self._grow(self._size + 1)
+            data = self._data
+        data[(self._head + self._size) % len(data)] = item
+        self._size += 1
+
+    def add_right_many(self, items: Iterable[T]) -> None:
+        ''' adds every item from items to the right end of the buffer, in order '''
+        items = list(items)
+        if self._size + len(items) > len(self._data):
+            self._grow(self._size + len(items))
+
+        data = self._data
+        cap  = len(data)
+        tail = (self._head + self._size) % cap
+        # copy in at most two slices: up to the end of the list, then the
+        # remainder wrapped around to the start
+        first = min(len(items), cap - tail)
+        data[tail:tail + first] = items[:first]
+        data[0:len(items) - first] = items[first:]
+        self._size += len(items)
+
+    def remove_left(self) -> T:
+        ''' removes and returns the leftmost item
+        Raises:
+            EmptyError exception if the buffer is empty
+        '''
+        if self._size == 0:
+            raise EmptyError('cannot remove_left from an empty buffer')
+        data  = self._data
+        value = data[self._head]
+        data[self._head] = None   # drop the reference so it can be collected
+        self._head = (self._head + 1) % len(data)
+        self._size -= 1
+        return value
+
+    def remove_left_many(self, n: int) -> list[T]:
+        ''' removes and returns up to n items from the left end of the buffer
+        Returns:
+            list of the removed items, leftmost first; shorter than n if the
+            buffer held fewer than n items
+        '''
+        n = max(0, min(n, self._size))
+        data = self._data
+        cap  = len(data)
+        head = self._head
+
+        first  = min(n, cap - head)
+        result = data[head:head + first] + data[0:n - first]
+        data[head:head + first] = [None] * first
+        data[0:n - first]       = [None] * (n - first)
+
+        self._head = (head + n) % cap
+        self._size -= n
+        return result
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from array import array
+from typing import Any
+
+from SearchStats import SearchStats
+
+###########################################################
+class SearchContext:
+    ''' class to hold the state of one search over a Maze -- which cells
+        have been seen and which cell each one was reached from -- in
+        compact flat arrays indexed the same way as the Maze's Grid; keeping
+        this out of the Maze lets any number of searches share one maze '''
+    __slots__ = ('_parent', '_seen', '_expanded', '_stats', '__weakref__')
+
+    def __init__(self, size: int, stats: SearchStats | None = None) -> None:
+        ''' SearchContext initializer method
+        Parameters:
+            size:  number of cells in the grid being searched
+            stats: optional SearchStats to instrument the search with
+        '''
+        self._parent:   array     = array('q', [-1]) * size  # -1 means no parent
+        self._seen:     bytearray = bytearray(size)
+        self._expanded: int       = 0   # number of cells taken off the frontier
+        self._stats:    SearchStats | None = stats
+        if stats is not None:
+            stats.attach(self)
+
+    def __del__(self) -> None:
+        if self._stats is not None:
+            self._stats.detach(self)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def isSeen(self, index: int) -> bool:    return self._seen[index] != 0
+    def getParent(self, index: int) -> int:  return self._parent[index]
+    def getExpanded(self) -> int:            return self._expanded
+    def getStats(self) -> SearchStats | None: return self._stats
+
+    def frontier(self, container: Any) -> Any:
+        ''' returns the container a search should use as its frontier: the
+            container itself, or, if this context has stats, the container
+            wrapped so its pushes and pops are counted '''
+        return container if self._stats is None else self._stats.frontier(container)
+
+    def visit(self, index: int, parent: int = -1) -> None:
+        ''' marks the cell at index as seen, remembering where it came from '''
+        self._seen[index]   = 1
+        self._parent[index] = parent
+
+    def pathTo(self, index: int) -> list[int]:
+        ''' follows parent links back from index to the cell the search began at
+        Returns:
+            list of flat indices, ordered from the root of the search to index
+        '''
+        path   = []
+        parent = self._parent
+        while index != -1:
+            path.append(index)
+            index = parent[index]
+        path.reverse()
+        return path
+
+    def reset(self) -> None:
+        ''' clears all state so the context can be reused for another search;
+            any attached SearchStats is kept, and keeps accumulating '''
+        self._parent[:] = array('q', [-1]) * len(self._parent)
+        self._seen[:]   = bytearray(len(self._seen))
+        if self._stats is not None:
+            self._stats._banked += self._expanded
+        self._expanded  = 0
@@ -0,0 +1,155 @@
+from __future__ import annotations
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+###########################################################
+class SearchStats:
+    ''' class to collect instrumentation for one search: how many cells were
+        expanded, how many items went through the frontier, how large the
+        frontier grew, and how long each phase took; a search only pays for
+        this when a SearchStats is attached to its SearchContext, and then
+        only through the wrapped frontier, never in code shared with
+        uninstrumented searches; expansions are read from the SearchContexts
+        the stats are attached to, which count them anyway (the contexts are
+        only weakly referenced, and bank their count here when freed, so
+        long-lived stats do not keep every search's arrays alive)
+
+        phases timed: "path" (building the path's Cells), "showPath", and
+        "getSearchLocations" when that is called directly (the searches
+        expand neighbours inline, so they never call it); Maze.profile adds
+        "search" for the whole search '''
+    __slots__ = ('_contexts', '_banked', 'pushes', 'pops', 'peak_frontier', 'timings', 'callback')
+
+    def __init__(self, callback: Callable[[Any, int], None] | None = None) -> None:
+        ''' SearchStats initializer method
+        Parameters:
+            callback: optional hook called as callback(item, frontier_size)
+                      each time an item is popped off an instrumented frontier
+        '''
+        self._contexts:     weakref.WeakSet   = weakref.WeakSet()  # live attached SearchContexts
+        self._banked:       int               = 0    # expansions of freed or reset contexts
+        self.pushes:        int               = 0
+        self.pops:          int               = 0
+        self.peak_frontier: int               = 0
+        self.timings:       dict[str, float]  = {}   # phase name -> seconds
+        self.callback = callback
+
+    @property
+    def expanded(self) -> int:
+        ''' the number of cells expanded by every search these stats are
+            attached to '''
+        return self._banked + sum(context._expanded for context in self._contexts)
+
+    def attach(self, context) -> None:
+        ''' counts the given SearchContext's expansions in these stats; done by
+            SearchContext itself when it is created with stats '''
+        self._contexts.add(context)
+
+    def detach(self, context) -> None:
+        ''' banks the given SearchContext's expansions and stops following it;
+            done by SearchContext itself when it is freed '''
+        self._banked += context._expanded
+        self._contexts.discard(context)
+
+    def frontier(self, container: Any) -> Frontier:
+        ''' wraps a Stack, Queue or PriorityQueue so its traffic is counted here '''
+        return Frontier(container, self)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        ''' times the body of a with statement, adding the seconds it took to
+            timings[name] (so a phase entered repeatedly accumulates) '''
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - began
+
+    def asdict(self) -> dict[str, Any]:
+        return {"expanded": self.expanded, "pushes": self.pushes, "pops": self.pops,
+                "peak_frontier": self.peak_frontier, "timings": dict(self.timings)}
+
+    def __str__(self) -> str:
+        timings = ", ".join(f"{name} {seconds * 1000:.3f}ms" for name, seconds in self.timings.items())
+        return f"expanded {self.expanded}, pushes {self.pushes}, pops {self.pops}, " \
+               f"peak frontier {self.peak_frontier}" + (f"; {timings}" if timings else "")
+
+
+###########################################################
+class Frontier:
+    ''' class to wrap a search frontier container, counting its pushes and
+        pops into a SearchStats and tracking its largest size; it offers the
+        union of the Stack, Queue and PriorityQueue interfaces, forwarding
+        each call to the wrapped container '''
+    __slots__ = ('_data', '_stats')
+
+    def __init__(self, container: Any, stats: SearchStats) -> None:
+        self._data  = container
+        self._stats = stats
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _grew(self) -> None:
+        size = len(self._data)
+        if size > self._stats.peak_frontier:
+            self._stats.peak_frontier = size
+
+    def push(self, *args: Any) -> None:
+        ''' pushes onto the wrapped container; takes whatever arguments its
+            push does (an item, or an item and a priority) '''
+        self._data.push(*args)
+        self._stats.pushes += 1
+        self._grew()
+
+    def push_many(self, items) -> None:
+        items = list(items)
+        self._data.push_many(items)
+        self._stats.pushes += len(items)
+        self._grew()
+
+    def pop(self) -> Any:
+        item  = self._data.pop()
+        stats = self._stats
+        stats.pops += 1
+        if stats.callback is not None:
+            stats.callback(item, len(self._data))
+        return item
+
+    def pop_many(self, n: int) -> list:
+        items = self._data.pop_many(n)
+        stats = self._stats
+        stats.pops += len(items)
+        if stats.callback is not None:
+            remaining = len(self._data)
+            for item in items:
+                stats.callback(item, remaining)
+        return items
+
+    def top(self) -> Any:
+        return self._data.top()
+
+    def is_empty(self) -> bool:
+        return len(self._data) == 0
+
+    isempty = is_empty   # Queue spells it this way
+
+
+###################
+def main() -> None:
+    from Queue import Queue
+
+    stats = SearchStats(callback=lambda item, size: print(f"popped {item}, {size} left"))
+    queue = stats.frontier(Queue(ring=True))
+    with stats.phase("fill"):
+        queue.push_many(range(5))
+    with stats.phase("drain"):
+        while not queue.isempty():
+            queue.pop()
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
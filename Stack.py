@@ -2,7 +2,7 @@
 # https://docs.python.org/3/library/typing.html#generics
 # https://www.youtube.com/watch?v=q6ujWWaRdbA
 
-from typing import TypeVar
+from typing import Iterable, TypeVar
 
 T = TypeVar('T')
 
@@ -14,10 +14,20 @@ class EmptyError(Exception):
 class Stack[T]:
     ''' class to implement a stack ADT using a Python list '''
 
-    __slots__ = ("_data")
+    __slots__ = ("_data", "_type", "_strict")
 
-    def __init__(self):
+    def __init__(self, item_type: type | None = None, strict: bool = True):
+        ''' Stack initializer method
+        Parameters:
+            item_type: type every pushed item must be an instance of; if None,
+                       it is fixed by the first push
+            strict:    if False, pushes skip the type check entirely (a
+                       "trusted" fast path for hot loops that only ever push
+                       one type)
+        '''
         self._data: list[T] = []    # typing _data to be a list of type T
+        self._type: type | None = item_type
+        self._strict: bool = strict
 
     def __len__(self) -> int:
         ''' allows the len function to be called using an ArrayStack object, e.g.,
@@ -35,15 +45,32 @@ class Stack[T]:
         Returns:
             None
         Raises:
-            TypeError if type pushed to non-empty stack does not match type
-                of previously pushed element(s) (presumably type T)
+            TypeError if, in strict mode, item is not an instance of the
+                stack's item type (presumably type T)
         '''
-        if len(self) > 0:
-            t = type(self.top())
-            if not isinstance(item, t):
-                raise TypeError(f"cannot push {type(item).__name__} to stack of {t.__name__}")
+        if self._strict:
+            if self._type is None:
+                self._type = type(item)
+            elif not isinstance(item, self._type):
+                raise TypeError(f"cannot push {type(item).__name__} to stack of {self._type.__name__}")
         self._data.append(item)
 
+    def push_many(self, items: Iterable[T]) -> None:
+        ''' pushes every item from items onto the stack, in order, so the
+            last item ends up on top
+        Raises:
+            TypeError if, in strict mode, any item is not an instance of the
+                stack's item type; nothing is pushed in that case
+        '''
+        if self._strict:
+            items = list(items)
+            for item in items:
+                if self._type is None:
+                    self._type = type(item)
+                elif not isinstance(item, self._type):
+                    raise TypeError(f"cannot push {type(item).__name__} to stack of {self._type.__name__}")
+        self._data.extend(items)
+
     def pop(self) -> T:
         ''' removes the topmost element from the stack and returns that element
         Returns:
@@ -123,6 +150,10 @@ def main() -> None:
     except TypeError as err:
         print(f"Successfully caught invalid push: {err}")
 
+    s4 = Stack[int](strict=False)
+    s4.push_many(range(5))
+    print(s4)
+
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Iterable, Iterator
 
 ######################################################################
 
@@ -25,6 +26,27 @@ def test_linked_list():
     assert ll.remove_right() == 4, "remove_right failed"
     assert str(ll) == 'head->[1]<->[3]<-tail', "remove_left or remove_right failed"
 
+    # Test __iter__ and __reversed__
+    assert list(ll) == [1, 3], "__iter__ failed"
+    assert list(reversed(ll)) == [3, 1], "__reversed__ failed"
+
+    # Test splice and concat
+    other = LinkedList[int]()
+    other.extend([7, 8])
+    ll.splice(other, left=True)
+    assert str(ll) == 'head->[7]<->[8]<->[1]<->[3]<-tail' and len(other) == 0, "splice failed"
+    other.extend([9])
+    ll.concat(other)
+    assert list(ll) == [7, 8, 1, 3, 9] and len(ll) == 5, "concat failed"
+
+    # Test node pooling
+    pooled = LinkedList[int](pool=True)
+    pooled.add_right(1)
+    node = pooled._head
+    pooled.remove_left()
+    pooled.add_left(2)
+    assert pooled._head is node and pooled.front() == 2, "node pooling failed"
+
     # Add more tests as needed
     print("All tests passed!")
 
@@ -38,6 +60,8 @@ class EmptyError(Exception):
 ######################################################################
 class Node[T]:
     ''' class to represent a node in a doubly-linked list '''
+    __slots__ = ('data', 'prev', 'next')
+
     def __init__(self, data: T):
         self.data: T      = data
         self.prev: Node[T] = None  # pointer to the previous Node in the list
@@ -46,12 +70,56 @@ class Node[T]:
 ######################################################################
 class LinkedList[T]:
     #''' class to implement a doubly-linked list '''
-    __slots__ = ('_head', '_tail', '_size')
+    __slots__ = ('_head', '_tail', '_size', '_type', '_strict', '_pool', '_free')
 
-    def __init__(self) -> None:
+    def __init__(self, item_type: type | None = None, strict: bool = True, \
+                       pool: bool = False) -> None:
+        ''' LinkedList initializer method
+        Parameters:
+            item_type: the exact type every added item must have; if None, it
+                       is fixed by the first add
+            strict:    if False, adds skip the type check entirely (a
+                       "trusted" fast path for lists of one known type)
+            pool:      if True, removed Nodes are kept on a free list and
+                       reused by later adds instead of being garbage collected
+        '''
         self._head: Node[T] = None   # the head pointer in the linked list
         self._tail: Node[T] = None   # the tail pointer in the linked list
         self._size: int     = 0      # number of entries in the list
+        self._type: type | None = item_type
+        self._strict: bool  = strict
+        self._pool:   bool  = pool
+        self._free: Node[T] = None   # singly-linked (via .next) list of spare Nodes
+
+    def _newNode(self, item: T) -> Node[T]:
+        ''' returns a Node holding item, reusing one from the free list if
+            there is one '''
+        node = self._free
+        if node is None:
+            return Node(item)
+        self._free = node.next
+        node.data = item
+        node.next = None
+        return node
+
+    def _release(self, node: Node[T]) -> None:
+        ''' puts a removed Node on the free list, if pooling is enabled '''
+        if self._pool:
+            node.data = None   # drop the reference so the item can be collected
+            node.prev = None
+            node.next = self._free
+            self._free = node
+
+    def _check(self, item: T) -> None:
+        ''' fixes the list's item type on the first add, and checks it after
+        Raises:
+            TypeError if item type does not match the list's item type
+        '''
+        if self._type is None:
+            self._type = type(item)
+        elif type(item) is not self._type:
+            msg = f'Only supporting list of single data type. Type of attmpeted add : {type(item)}. Type currently in list : {self._type}'
+            raise TypeError(msg)
 
     def __len__(self) -> int:
         ''' returns the number of entries in the linked list
@@ -60,6 +128,20 @@ class LinkedList[T]:
         '''
         return self._size
 
+    def __iter__(self) -> Iterator[T]:
+        ''' walks the data items from head to tail, without copying them '''
+        ptr_ = self._head
+        while ptr_ is not None:
+            yield ptr_.data
+            ptr_ = ptr_.next
+
+    def __reversed__(self) -> Iterator[T]:
+        ''' walks the data items from tail to head, without copying them '''
+        ptr_ = self._tail
+        while ptr_ is not None:
+            yield ptr_.data
+            ptr_ = ptr_.prev
+
     def front(self) -> T:
         ''' method to return the data item at the front of the list without
             removing that node
@@ -94,15 +176,13 @@ class LinkedList[T]:
         Parameters:
             item: a type T data item to be included as the data in the inserted Node
         Raises:
-            TypeError if non-empty list and item type does not match list entry types
+            TypeError if, in strict mode, item type does not match the list's item type
         '''
 
 
-        if self._size != 0 and type(item) != type(self._head.data):
-            msg = f'Only supporting list of single data type. Type of attmpeted add : {type(item)}. Type currently in list : {type(self._head.data)}'
-            raise TypeError(msg)
+        if self._strict: self._check(item)
 
-        new_node = Node(item)
+        new_node = self._newNode(item)
 
         if self._head is None:
            self._head = self._tail = new_node
@@ -128,15 +208,13 @@ class LinkedList[T]:
         Parameters:
             item: a type T data item to be included as the data in the inserted Node
         Raises:
-            TypeError if non-empty list and item type does not match list entry types
+            TypeError if, in strict mode, item type does not match the list's item type
         '''
 
 
-        if self._size != 0 and type(item) != type(self._head.data):
-            msg = f'Only supporting list of single data type. Type of attmpeted add : {type(item)}. Type currently in list : {type(self._head.data)}'
-            raise TypeError(msg)
+        if self._strict: self._check(item)
 
-        new_node = Node(item)
+        new_node = self._newNode(item)
 
         if self._head is None:
            self._head = self._tail = new_node
@@ -156,6 +234,35 @@ class LinkedList[T]:
 
      
 
+    def add_right_many(self, items: Iterable[T]) -> None:
+        ''' adds every item from the given iterable to the right of the
+            linked list, in order, linking the new Nodes directly
+        Parameters:
+            items: an iterable of type T data items
+        Raises:
+            TypeError if, in strict mode, an item type does not match the
+                list's item type; nothing is added in that case
+        '''
+        if self._strict:
+            items = list(items)
+            for item in items: self._check(item)
+
+        tail = self._tail
+        for item in items:
+            new_node = self._newNode(item)
+            if tail is None:
+                self._head = new_node
+            else:
+                tail.next = new_node
+                new_node.prev = tail
+            tail = new_node
+            self._size += 1
+        self._tail = tail
+
+    def extend(self, items: Iterable[T]) -> None:
+        ''' same as add_right_many '''
+        self.add_right_many(items)
+
     def remove_left(self) -> T:
         ''' removes the first Node in the linked list, returning the data item
             inside that Node
@@ -171,7 +278,8 @@ class LinkedList[T]:
             raise EmptyError('cannot remove_left from an empty list')
         
 
-        value : T = self._head.data
+        node = self._head
+        value : T = node.data
 
         if self._size == 1:
             self._head = self._tail = None
@@ -181,6 +289,7 @@ class LinkedList[T]:
             self._head.prev = None
         
         self._size -=1
+        self._release(node)
 
         return value
 
@@ -199,7 +308,8 @@ class LinkedList[T]:
             raise EmptyError('cannot remove_left from an empty list')
         
 
-        value : T = self._tail.data
+        node = self._tail
+        value : T = node.data
 
         if self._size == 1:
             self._head = self._tail = None
@@ -211,25 +321,66 @@ class LinkedList[T]:
             self._tail.next = None
         
         self._size-=1
+        self._release(node)
         return value
 
+    def remove_left_many(self, n: int) -> list[T]:
+        ''' removes up to n Nodes from the left of the linked list
+        Returns:
+            list of the removed data items, leftmost first; shorter than n
+            if the list held fewer than n items
+        '''
+        return [self.remove_left() for _ in range(min(n, self._size))]
+
+    def splice(self, other: LinkedList[T], left: bool = False) -> None:
+        ''' moves every Node of other onto the right (or left) end of this
+            list in O(1), by relinking the two ends; other is left empty
+        Parameters:
+            other: the list whose Nodes are taken
+            left:  if True, other's Nodes go before this list's head
+        Raises:
+            ValueError if other is this list
+            TypeError if, in strict mode, both lists have item types and
+                they differ
+        '''
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+        if other._size == 0:
+            return
+        if self._strict and other._type is not None:
+            if self._type is None:
+                self._type = other._type
+            elif other._type is not self._type:
+                raise TypeError(f'cannot splice list of {other._type} into list of {self._type}')
+
+        if self._size == 0:
+            self._head, self._tail = other._head, other._tail
+        elif left:
+            other._tail.next = self._head
+            self._head.prev  = other._tail
+            self._head = other._head
+        else:
+            self._tail.next  = other._head
+            other._head.prev = self._tail
+            self._tail = other._tail
+
+        self._size += other._size
+        other._head = other._tail = None
+        other._size = 0
+
+    def concat(self, other: LinkedList[T]) -> None:
+        ''' same as splice(other): appends other's Nodes in O(1), leaving it empty '''
+        self.splice(other)
+
     def __str__(self):
         ''' a str representation of the linked list data
         Returns:
             str representation of the linked list, showing head and tail
             pointers and list data items
         '''
-        str_ = "head->"
-        # start out at the head Node, and walk through Node by Node until we
-        # reach the end of the linked list (i.e., the ._next entry is None)
-        ptr_ = self._head
-        while ptr_ is not None:
-            str_ += "[" + str(ptr_.data) + "]<->" 
-            ptr_ = ptr_.next  # move ptr_ to the next Node in the linked list
-
-        if self._head != None: str_ = str_[:-3]  # remove the last "<->"
-        str_ += "<-tail"
-        return str_
+        # walk the list once with __iter__ and join the pieces, rather than
+        # growing a string with += for every Node
+        return "head->" + "<->".join(f"[{datum}]" for datum in self) + "<-tail"
         
 ###################
 def main() -> None: